@@ -1,12 +1,281 @@
+from cachetools import TTLCache
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Optional, Union
 from fastmcp import FastMCP
+from rapidfuzz import fuzz, process
 import asana
+import asyncio
+import bisect
+import functools
+import httpx
+import json
 import os
+import re
+import logging
+import threading
+import time
+import urllib3
 
-# Initialize the FastMCP server
-mcp = FastMCP("AsanaTaskManager")
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and unavailable on Windows)
+    uvloop = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+# Parse Asana response bodies straight from bytes, with orjson when available
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+log = logging.getLogger(__name__)
 
 # Initialize Asana client using access token
-token = os.getenv("ASANA_ACCESS_TOKEN")
+token = os.environ.get("ASANA_ACCESS_TOKEN", "").strip()
+if not token:
+    raise RuntimeError("ASANA_ACCESS_TOKEN is not set")
+
+# Shared async HTTP session for the Asana REST API (lazily created on first use)
+ASANA_API_BASE = "https://app.asana.com/api/1.0"
+_SESSION: Optional[httpx.AsyncClient] = None
+
+# Retry policy shared by the SDK and the async session: rate limits are always
+# retried, server errors only for idempotent methods (like urllib3's Retry)
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.3
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+
+def _session() -> httpx.AsyncClient:
+    """
+    Return the shared Asana HTTP session, creating it on first use.
+    """
+    global _SESSION
+    if _SESSION is None or _SESSION.is_closed:
+        _SESSION = httpx.AsyncClient(
+            base_url=ASANA_API_BASE,
+            headers={"Authorization": f"Bearer {token}"},
+            # Connection failures are retried by the transport (nothing was sent yet)
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=60),
+                retries=_RETRY_TOTAL
+            ),
+            timeout=30.0
+        )
+    return _SESSION
+
+def _raise_for_asana_error(response: httpx.Response) -> None:
+    """
+    Raise a RuntimeError carrying Asana's error messages if the response failed.
+    
+    A 401 also drops the cached user and workspace (see invalidate_workspace_cache),
+    so they are re-read once the token is fixed or rotated.
+    """
+    if not response.is_error:
+        return
+    if response.status_code == 401:
+        invalidate_workspace_cache()
+    try:
+        errors = _json_loads(response.content).get('errors', [])
+        message = "; ".join(error.get('message', '') for error in errors)
+    except ValueError:
+        message = ""
+    raise RuntimeError(f"Asana API error {response.status_code}: {message or response.reason_phrase}")
+
+def _is_retryable(method: str, status: int) -> bool:
+    """
+    Tell whether a failed request may safely be sent again under the retry policy.
+    """
+    return status in _RETRY_STATUSES and (status == 429 or method.upper() in _IDEMPOTENT_METHODS)
+
+async def _send(method: str, path: str, params: Optional[dict] = None, body: Optional[dict] = None) -> httpx.Response:
+    """
+    Send a request on the shared session, retrying transient failures with exponential backoff.
+    
+    A Retry-After header on a 429 takes precedence over the backoff.
+    """
+    for attempt in range(_RETRY_TOTAL + 1):
+        response = await _session().request(method, path, params=params, json=body)
+        status = response.status_code
+        if attempt == _RETRY_TOTAL or not _is_retryable(method, status):
+            return response
+        retry_after = response.headers.get("Retry-After", "")
+        delay = float(retry_after) if retry_after.isdigit() else _RETRY_BACKOFF * (2 ** attempt)
+        log.debug("Asana returned %s for %s %s; retrying in %.1fs", status, method, path, delay)
+        await asyncio.sleep(delay)
+
+async def _asana_request(method: str, path: str, params: Optional[dict] = None, data: Optional[dict] = None) -> dict:
+    """
+    Issue a request against the Asana REST API and return the response's 'data' payload.
+    """
+    response = await _send(
+        method, path, params=params,
+        body={'data': data} if data is not None else None
+    )
+    _raise_for_asana_error(response)
+    return _json_loads(response.content)['data']
+
+async def _iter_asana(path: str, params: Optional[dict] = None):
+    """
+    Iterate over every item of a paginated Asana collection endpoint, one page at a time.
+    
+    Pages hold 100 items unless params sets a smaller 'limit'.
+    """
+    params = {'limit': 100, **(params or {})}
+    while True:
+        response = await _send("GET", path, params=params)
+        _raise_for_asana_error(response)
+        payload = _json_loads(response.content)
+        for item in payload.get('data', []):
+            yield item
+        next_page = payload.get('next_page')
+        if not next_page:
+            break
+        params['offset'] = next_page['offset']
+
+class _BatchCoalescer:
+    """
+    Coalesce Asana requests issued concurrently into POST /batch calls.
+    
+    Requests arriving within a short window (or until the batch is full) are sent
+    as one batch; a request that arrives alone is sent directly. Actions the batch
+    rejects transiently (e.g. rate limited) fall back to an individual request.
+    """
+    
+    def __init__(self, window: float = 0.015, max_actions: int = 10):
+        self._window = window
+        self._max_actions = max_actions
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._dispatches = set()
+    
+    async def submit(self, method: str, path: str, params: Optional[dict] = None, data: Optional[dict] = None) -> dict:
+        """
+        Queue a request and wait for its 'data' payload.
+        """
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((method, path, params, data, future))
+        return await future
+    
+    async def close(self) -> None:
+        """
+        Stop the background worker.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+    
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._window
+            while len(batch) < self._max_actions:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            dispatch = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(dispatch)
+            dispatch.add_done_callback(self._dispatches.discard)
+    
+    async def _dispatch(self, batch: list) -> None:
+        if len(batch) == 1:
+            method, path, params, data, future = batch[0]
+            try:
+                _settle(future, result=await _asana_request(method, path, params=params, data=data))
+            except Exception as e:
+                _settle(future, error=e)
+            return
+        
+        actions = [self._action(method, path, params, data) for method, path, params, data, _ in batch]
+        try:
+            responses = await _asana_request("POST", "/batch", data={'actions': actions})
+        except Exception as e:
+            for *_, future in batch:
+                _settle(future, error=e)
+            return
+        
+        if (
+            not isinstance(responses, list)
+            or len(responses) != len(batch)
+            or not all(isinstance(response, dict) for response in responses)
+        ):
+            # A malformed reply can't be matched to its actions; never leave a caller waiting
+            error = RuntimeError(f"Asana /batch returned an unexpected response for {len(batch)} actions")
+            for *_, future in batch:
+                _settle(future, error=error)
+            return
+        
+        retries = []
+        for (method, path, params, data, future), response in zip(batch, responses):
+            body = response.get('body') or {}
+            status_code = response.get('status_code', 500)
+            if _is_retryable(method, status_code):
+                retries.append(self._dispatch([(method, path, params, data, future)]))
+            elif status_code >= 400:
+                message = "; ".join(error.get('message', '') for error in body.get('errors', []))
+                _settle(future, error=RuntimeError(f"Asana API error {status_code}: {message}"))
+            else:
+                _settle(future, result=body.get('data'))
+        if retries:
+            await asyncio.gather(*retries)
+    
+    @staticmethod
+    def _action(method: str, path: str, params: Optional[dict], data: Optional[dict]) -> dict:
+        action = {'relative_path': path, 'method': method.lower()}
+        params = dict(params or {})
+        opt_fields = params.pop('opt_fields', None)
+        if opt_fields:
+            action['options'] = {'fields': opt_fields.split(',')}
+        # For GET actions the batch API takes query parameters in 'data'
+        if method.upper() == "GET":
+            data = {**params, **(data or {})}
+        if data:
+            action['data'] = data
+        return action
+
+def _settle(future: asyncio.Future, result=None, error: Optional[Exception] = None) -> None:
+    """
+    Resolve a pending future unless its caller has already given up on it.
+    """
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+_batcher = _BatchCoalescer()
+
+@asynccontextmanager
+async def _lifespan(server):
+    """
+    Close the shared Asana HTTP session when the server shuts down.
+    """
+    try:
+        yield
+    finally:
+        await _batcher.close()
+        if _SESSION is not None:
+            await _SESSION.aclose()
+
+# Initialize the FastMCP server
+mcp = FastMCP("AsanaTaskManager", lifespan=_lifespan)
 
 asana_projects = {
     "Analytics Team Status": "1200797787407318",
@@ -14,9 +283,25 @@ asana_projects = {
 }
 
 # Dynamic user cache - automatically populated
-_user_cache = {}
+_user_names = {}  # Name variants and emails -> user GID
+_user_gids = frozenset()  # GIDs of every cached user
+_user_records = []  # Raw {'gid', 'name', 'email'} user dicts, for display
+_user_bigrams = {}  # Character bigrams of each name/email key, for prefiltering fuzzy matches
 _cache_timestamp = None
 _cache_duration = 3600  # Cache for 1 hour
+_cache_max_staleness = 86400  # Past this, wait for fresh users instead of serving stale ones
+_user_cache_lock = threading.Lock()  # Guards the cache swap and the in-flight flag
+_user_fetch_lock = threading.RLock()  # Single-flight: one workspace users fetch at a time
+_user_refresh_in_flight = False
+
+# Asana GIDs are long numeric strings; anything else is treated as a name
+_GID_RE = re.compile(r'\A[0-9]{11,}\Z')
+
+def _is_gid(value: str) -> bool:
+    """
+    Return True if value looks like an Asana GID rather than a name.
+    """
+    return _GID_RE.match(value) is not None
 
 # Workspace configuration
 WORKSPACE_GID = "1210163496628143"
@@ -93,21 +378,177 @@ asana_field_options = {
     }
 }
 
+# Lowercase-keyed copies of the option mappings, built once for case-insensitive lookups
+_asana_field_options_lc = {
+    field: {option_name.lower(): option_gid for option_name, option_gid in options.items()}
+    for field, options in asana_field_options.items()
+}
+_asana_field_options_items_lc = {field: list(options.items()) for field, options in _asana_field_options_lc.items()}
+
+# Lookup tables used when building task payloads
+_PRIORITY_MAP = MappingProxyType({'low': 'Low', 'medium': 'Medium', 'high': 'High', 'urgent': 'Urgent'})
+_COMPLETED_MAP = MappingProxyType({'true': True, 'false': False})
+
+# Completion glyphs used when rendering task lists
+_STATUS_ICONS = MappingProxyType({True: "✅", False: "❌"})
+
+# Query parameters, trimmed to the fields each caller reads. The SDK writes
+# paging state into the opts dict it is given, so SDK calls pass a dict() copy.
+_ME_OPTS = MappingProxyType({'opt_fields': 'gid,workspaces'})
+_USER_OPTS = MappingProxyType({'opt_fields': 'gid,name,email'})
+_NAME_OPTS = MappingProxyType({'opt_fields': 'name'})
+_TASK_REF_OPTS = MappingProxyType({'opt_fields': 'gid,name'})
+_CREATE_TASK_OPTS = MappingProxyType({'opt_fields': 'gid,name,permalink_url'})
+_UPDATE_TASK_OPTS = MappingProxyType({'opt_fields': 'gid,name,completed'})
+_GET_TASK_OPTS = MappingProxyType({'opt_fields': 'name,notes,completed,due_on,created_at,modified_at,assignee.name,projects.name,permalink_url'})
+_SEARCH_OPTS = MappingProxyType({'opt_fields': 'name,gid,completed,due_on,assignee.name'})
+_SEARCH_MATCH_OPTS = MappingProxyType({'opt_fields': 'name,gid'})
+_LIST_PROJECT_OPTS = MappingProxyType({'opt_fields': 'name,gid'})
+_PARENT_OPTS = MappingProxyType({'opt_fields': 'parent.name,parent.gid'})
+_SUBTASK_LIST_OPTS = MappingProxyType({'opt_fields': 'name,gid,completed,due_on,assignee.name'})
+_DEPENDENCY_OPTS = MappingProxyType({'opt_fields': 'name,dependencies.name,dependencies.gid,dependents.name,dependents.gid'})
+_TASK_PROJECTS_OPTS = MappingProxyType({'opt_fields': 'name,projects.name,projects.gid'})
+
 # Configure Asana client with access token
 configuration = asana.Configuration()
 configuration.access_token = token
-api_client = asana.ApiClient(configuration)
+
+# Share one keep-alive connection pool across every SDK call and keep retries short
+configuration.connection_pool_maxsize = 32
+configuration.retry_strategy = urllib3.Retry(
+    total=_RETRY_TOTAL,
+    backoff_factor=_RETRY_BACKOFF,
+    status_forcelist=sorted(_RETRY_STATUSES)
+)
 
 # Initialize API clients
+api_client = asana.ApiClient(configuration)
 tasks_api = asana.TasksApi(api_client)
 projects_api = asana.ProjectsApi(api_client)
 users_api = asana.UsersApi(api_client)
     
+# Authenticated user lookup (changes on the order of days, so cache it)
+_me_cache = TTLCache(maxsize=1, ttl=3600)
+
+async def _get_me() -> dict:
+    """
+    Get the authenticated Asana user, cached for an hour.
+    """
+    me = _me_cache.get('me')
+    if me is None:
+        me = await _asana_request("GET", "/users/me", params=_ME_OPTS)
+        _me_cache['me'] = me
+    return me
+
+async def _get_default_workspace_gid() -> str:
+    """
+    Get the GID of the authenticated user's first workspace.
+    """
+    me = await _get_me()
+    return me['workspaces'][0]['gid']
+
+def invalidate_workspace_cache() -> None:
+    """
+    Forget the cached authenticated user, so the next lookup re-reads the default workspace.
+    """
+    _me_cache.clear()
+
+# Short-lived response caches for repeated reads (e.g. "get the task, then update it")
+_task_cache = TTLCache(maxsize=512, ttl=30)
+_task_cache_lock = threading.Lock()
+_projects_cache = TTLCache(maxsize=8, ttl=60)
+# (project GID, casefolded query) -> matches, for back-to-back parent lookups by name
+_task_name_cache = TTLCache(maxsize=256, ttl=60)
+
+def _invalidate_task(task_gid: str) -> None:
+    """
+    Drop a task's cached details after it has been modified.
+    
+    Name lookups are dropped too, since a rename or project move can change their results.
+    """
+    with _task_cache_lock:
+        _task_cache.pop(task_gid, None)
+        _task_name_cache.clear()
+
+def _invalidate_task_names() -> None:
+    """
+    Forget cached task-name lookups, e.g. after a new task is created.
+    """
+    with _task_cache_lock:
+        _task_name_cache.clear()
+
+# Project name -> GID map fetched from Asana, for names missing from asana_projects
+_project_map_cache = TTLCache(maxsize=1, ttl=300)
+_project_map_lock = threading.Lock()
+
+# Reverse GID -> name index of the local mapping, for rendering friendly labels
+_gid_to_name = {gid: name for name, gid in asana_projects.items()}
+
+# Case-insensitive index of the local mapping, so "analytics team status" resolves without a fetch
+_asana_projects_ci = {name.casefold(): gid for name, gid in asana_projects.items()}
+
+def _project_map() -> tuple:
+    """
+    Get name -> GID maps of every project in the workspace, cached for 5 minutes.
+    
+    Returns the exact-name map and its casefolded counterpart. The reverse
+    GID -> name map is built alongside them (see _project_label).
+    """
+    with _project_map_lock:
+        maps = _project_map_cache.get('projects')
+        if maps is None:
+            projects = projects_api.get_projects(opts={**_LIST_PROJECT_OPTS, 'workspace': WORKSPACE_GID})
+            name_to_gid = {project['name']: project['gid'] for project in projects}
+            maps = (
+                name_to_gid,
+                {gid: name for name, gid in name_to_gid.items()},
+                {name.casefold(): gid for name, gid in name_to_gid.items()}
+            )
+            _project_map_cache['projects'] = maps
+        return maps[0], maps[2]
+
+def _project_label(project: str) -> str:
+    """
+    Get a friendly name for a project GID without touching the network.
+    """
+    if project in _gid_to_name:
+        return _gid_to_name[project]
+    with _project_map_lock:
+        maps = _project_map_cache.get('projects')
+    if maps and project in maps[1]:
+        return maps[1][project]
+    return project
+
+def _resolve_project_gid(project: str) -> str:
+    """
+    Resolve a project name or GID to a GID.
+    
+    Checks the local asana_projects mapping first and only falls back to the
+    workspace's project list (fetched once, then cached) for unknown names.
+    Exact names win over case-insensitive ones at each step.
+    """
+    if project in asana_projects:
+        return asana_projects[project]
+    if _is_gid(project):
+        return project
+    key = project.casefold()
+    if key in _asana_projects_ci:
+        return _asana_projects_ci[key]
+    try:
+        name_to_gid, name_to_gid_ci = _project_map()
+        if project in name_to_gid:
+            return name_to_gid[project]
+        return name_to_gid_ci.get(key, project)
+    except Exception as e:
+        log.error("Error fetching workspace projects: %s", e)
+        return project
 
 
 # Asana Task Management Tools
 
-def get_custom_field_value(field_name: str, value: str) -> str:
+@functools.lru_cache(maxsize=1024)
+def get_custom_field_value(field_name: str, value: str,
+                           _options=_asana_field_options_lc, _option_items=_asana_field_options_items_lc) -> str:
     """
     Get the option GID for a custom field enum value.
     
@@ -125,102 +566,157 @@ def get_custom_field_value(field_name: str, value: str) -> str:
     value_lower = value.lower()
     
     # Check if we have options for this field
-    if field_name in asana_field_options:
-        field_options = asana_field_options[field_name]
+    if field_name in _options:
+        field_options = _options[field_name]
         
         # Try exact match first
         if value_lower in field_options:
             return field_options[value_lower]
         
         # Try partial match
-        for option_name, option_gid in field_options.items():
-            if value_lower in option_name.lower() or option_name.lower() in value_lower:
+        for option_name, option_gid in _option_items[field_name]:
+            if value_lower in option_name or option_name in value_lower:
                 return option_gid
     
     # If no match found, return original value (might be a GID already)
     return value
 
-def _fetch_workspace_users():
+def _iter_items(response):
     """
-    Fetch and cache workspace users with detailed error handling.
-    """
-    global _user_cache, _cache_timestamp
-    import time
-    
-    # Check if cache is still valid
-    current_time = time.time()
-    if _cache_timestamp and (current_time - _cache_timestamp) < _cache_duration and _user_cache:
-        return _user_cache
+    Iterate over the items of an SDK collection response without materializing it.
     
-    if not users_api:
-        print("Error: users_api not initialized")
-        return {}
+    The SDK returns a generator that requests further pages only as it is consumed;
+    a {'data': [...]} payload, a list, or a single item are accepted as well.
+    """
+    if isinstance(response, dict):
+        return iter(response['data'] if 'data' in response else [response])
+    return iter(response or ())
+
+def _rows(response) -> list:
+    """
+    Materialize an SDK collection response (see _iter_items) as a list.
+    """
+    return list(_iter_items(response))
+
+def _bigrams(text: str) -> frozenset:
+    """
+    Return the set of two-character substrings of text.
+    """
+    return frozenset(text[i:i + 2] for i in range(len(text) - 1))
+
+def _refresh_workspace_users():
+    """
+    Fetch workspace users and swap a freshly built lookup cache into place.
+    """
+    global _user_names, _user_gids, _user_records, _user_bigrams, _cache_timestamp
     
     try:
         # Use configured workspace GID
         workspace_gid = WORKSPACE_GID
-        print(f"Debug: Using workspace GID: {workspace_gid}")
+        log.debug("Using workspace GID: %s", workspace_gid)
         
         # Fetch users with better error handling
         users_response = users_api.get_users_for_workspace(
             workspace_gid=workspace_gid,
-            opts={'opt_fields': 'gid,name,email'}
+            opts=dict(_USER_OPTS)
         )
         
-        # Handle both list and dict responses
-        if isinstance(users_response, dict) and 'data' in users_response:
-            users = users_response['data']
-        elif isinstance(users_response, list):
-            users = users_response
-        else:
-            users = [users_response] if users_response else []
+        users = _rows(users_response)
         
-        print(f"Debug: Found {len(users)} users in workspace")
+        log.debug("Found %d users in workspace", len(users))
         
         # Build cache with multiple lookup keys
-        _user_cache = {}
+        user_names = {}
+        user_gids = set()
+        user_records = []
         for user in users:
             if not isinstance(user, dict):
                 continue
+            user_records.append(user)
                 
-            name = user.get('name', '').strip()
-            email = user.get('email', '').strip()
-            gid = user.get('gid', '').strip()
+            # Normalize once; every lookup key below is derived from these
+            name = (user.get('name') or '').strip().lower()
+            email = (user.get('email') or '').strip().lower()
+            gid = (user.get('gid') or '').strip()
             
             if not gid:
                 continue
                 
-            print(f"Debug: Processing user - Name: '{name}', Email: '{email}', GID: {gid}")
+            log.debug("Processing user - Name: '%s', Email: '%s', GID: %s", name, email, gid)
             
-            # Add exact name
+            # Exact name, first name + last initial (e.g., "john d" for "John Doe"),
+            # first name only, and email
+            keys = []
             if name:
-                _user_cache[name.lower()] = gid
-                
-                # Add first name + last initial (e.g., "John D" for "John Doe")
+                keys.append(name)
                 name_parts = name.split()
                 if len(name_parts) >= 2:
-                    first_last_initial = f"{name_parts[0]} {name_parts[-1][0]}".lower()
-                    _user_cache[first_last_initial] = gid
-                    
-                    # Add first name only
-                    _user_cache[name_parts[0].lower()] = gid
-            
-            # Add email
+                    keys.append(f"{name_parts[0]} {name_parts[-1][0]}")
+                    keys.append(name_parts[0])
             if email:
-                _user_cache[email.lower()] = gid
-            
-            # Add GID (for direct lookups)
-            _user_cache[gid] = gid
-        
-        _cache_timestamp = current_time
-        print(f"Debug: User cache built with {len(_user_cache)} entries")
-        return _user_cache
+                keys.append(email)
+            user_names.update(dict.fromkeys(keys, gid))
+            user_gids.add(gid)
+        
+        user_bigrams = {key: _bigrams(key) for key in user_names}
+        with _user_cache_lock:
+            _user_names = user_names
+            _user_gids = frozenset(user_gids)
+            _user_records = user_records
+            _user_bigrams = user_bigrams
+            _cache_timestamp = time.time()
+        log.debug("User cache built with %d names for %d users", len(user_names), len(user_gids))
         
     except Exception as e:
-        print(f"Error fetching workspace users: {str(e)}")
-        import traceback
-        print(f"Full traceback: {traceback.format_exc()}")
-        return _user_cache if _user_cache else {}
+        log.error("Error fetching workspace users: %s", e)
+        # Only materialize the traceback when debug logging is on
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Workspace users fetch traceback", exc_info=True)
+
+def _refresh_workspace_users_in_background():
+    """
+    Refresh the user cache on a daemon thread, unless a refresh is already running.
+    """
+    global _user_refresh_in_flight
+    
+    with _user_cache_lock:
+        if _user_refresh_in_flight:
+            return
+        _user_refresh_in_flight = True
+    
+    def refresh():
+        global _user_refresh_in_flight
+        try:
+            with _user_fetch_lock:
+                _refresh_workspace_users()
+        finally:
+            with _user_cache_lock:
+                _user_refresh_in_flight = False
+    
+    threading.Thread(target=refresh, daemon=True).start()
+
+def _fetch_workspace_users():
+    """
+    Return the cached name/email -> GID map, refreshing it when the cache is stale.
+    
+    A stale cache is served immediately while it is refreshed in the background;
+    callers only wait when there is no usable cache (or a refresh was forced).
+    """
+    # Check if cache is still valid
+    age = time.time() - _cache_timestamp if _cache_timestamp else None
+    if _user_gids and age is not None:
+        if age < _cache_duration:
+            return _user_names
+        if age < _cache_max_staleness:
+            _refresh_workspace_users_in_background()
+            return _user_names
+    
+    # Concurrent misses wait for one fetch instead of each firing their own
+    requested_at = time.time()
+    with _user_fetch_lock:
+        if not (_cache_timestamp and _cache_timestamp >= requested_at):
+            _refresh_workspace_users()
+    return _user_names
 
 def resolve_assignee(assignee: str) -> str:
     """
@@ -235,73 +731,92 @@ def resolve_assignee(assignee: str) -> str:
     if not assignee:
         return ""
     
-    assignee_lower = assignee.lower().strip()
-    
     # If it looks like a GID, return as-is
-    if assignee.isdigit() and len(assignee) > 10:
+    if _is_gid(assignee):
         return assignee
     
-    # Fetch/update user cache
-    user_cache = _fetch_workspace_users()
-    
-    # Exact match
-    if assignee_lower in user_cache:
-        return user_cache[assignee_lower]
-    
-    # Fuzzy matching for partial names
-    best_match = None
-    best_score = 0
+    assignee_lower = assignee.lower().strip()
     
-    for cached_key, gid in user_cache.items():
-        if cached_key == gid:  # Skip GID entries
-            continue
-            
-        # Check if assignee is contained in cached name
-        if assignee_lower in cached_key:
-            score = len(assignee_lower) / len(cached_key)  # Prefer longer matches
-            if score > best_score:
-                best_match = gid
-                best_score = score
-        
-        # Check if cached name is contained in assignee
-        elif cached_key in assignee_lower:
-            score = len(cached_key) / len(assignee_lower)
-            if score > best_score:
-                best_match = gid
-                best_score = score
-    
-    # Return best match if confidence is high enough
-    if best_match and best_score > 0.3:
-        return best_match
+    # Fetch/update user cache
+    user_names = _fetch_workspace_users()
+    
+    # Exact match (by name or email, or a known short GID)
+    if assignee_lower in user_names:
+        return user_names[assignee_lower]
+    if assignee_lower in _user_gids:
+        return assignee_lower
+    
+    # Fuzzy matching for partial or misspelled names, scoring only keys that share
+    # enough bigrams with the query (queries too short for bigrams score every key)
+    query_bigrams = _bigrams(assignee_lower)
+    if query_bigrams:
+        candidates = [
+            key for key, key_bigrams in _user_bigrams.items()
+            if len(query_bigrams & key_bigrams) / len(query_bigrams) > 0.3
+        ]
+    else:
+        candidates = list(user_names)
+    match = process.extractOne(
+        assignee_lower, candidates,
+        scorer=fuzz.token_set_ratio, score_cutoff=60
+    )
+    if match and match[0] in user_names:
+        return user_names[match[0]]
     
     # If no match found, assume it's already a GID or email
     return assignee
 
-def _build_task_data(name: str = "", notes: str = "", project: str = "", assignee: str = "", 
-                    due_date: str = "", priority: str = "", client: str = "", platform: str = "", 
-                    status: str = "", effort: str = "", completed: str = "", new_name: str = "") -> dict:
+def _build_create_task_data(name: str = "", notes: str = "", project: str = "", assignee: str = "",
+                            due_date: str = "", priority: str = "", client: str = "", platform: str = "",
+                            status: str = "", effort: str = "") -> dict:
     """
-    Build task data dictionary with all validations and transformations.
+    Build the payload for a new task (or subtask) with all validations and transformations.
     """
-    from datetime import datetime, timedelta
-    
     task_data = {}
     
     # Basic fields
     if name:
         task_data['name'] = name
-    if new_name:
-        task_data['name'] = new_name
-    if notes:
-        task_data['notes'] = notes
-    if completed and completed.lower() in ['true', 'false']:
-        task_data['completed'] = completed.lower() == 'true'
     
     # Project
     if project:
-        project_gid = asana_projects.get(project, project)
+        project_gid = _resolve_project_gid(project)
         task_data['projects'] = [project_gid]
     
+    _add_shared_task_fields(task_data, notes, assignee, due_date, priority, client, platform, status, effort)
+    return task_data
+
+def _build_update_task_data(new_name: str = "", notes: str = "", completed: str = "", assignee: str = "",
+                            due_date: str = "", priority: str = "", client: str = "", platform: str = "",
+                            status: str = "", effort: str = "") -> dict:
+    """
+    Build the payload for updating an existing task with all validations and transformations.
+    """
+    # Nothing to update: skip the per-field checks (callers treat {} as "no fields provided")
+    if not any((new_name, notes, completed, assignee, due_date, priority, client, platform, status, effort)):
+        return {}
+    
+    task_data = {}
+    
+    # Basic fields
+    if new_name:
+        task_data['name'] = new_name
+    if completed:
+        completed_value = _COMPLETED_MAP.get(completed.lower())
+        if completed_value is not None:
+            task_data['completed'] = completed_value
+    
+    _add_shared_task_fields(task_data, notes, assignee, due_date, priority, client, platform, status, effort)
+    return task_data
+
+def _add_shared_task_fields(task_data: dict, notes: str, assignee: str, due_date: str, priority: str,
+                            client: str, platform: str, status: str, effort: str) -> None:
+    """
+    Add the fields that creating and updating a task have in common to task_data.
+    """
+    if notes:
+        task_data['notes'] = notes
+    
     # Assignee with intelligent resolution
     if assignee:
         task_data['assignee'] = resolve_assignee(assignee)
@@ -314,27 +829,111 @@ def _build_task_data(name: str = "", notes: str = "", project: str = "", assigne
     
     # Priority
     if priority:
-        priority_map = {'low': 'Low', 'medium': 'Medium', 'high': 'High', 'urgent': 'Urgent'}
-        if priority.lower() in priority_map:
-            task_data['priority'] = priority_map[priority.lower()]
+        mapped_priority = _PRIORITY_MAP.get(priority.lower())
+        if mapped_priority:
+            task_data['priority'] = mapped_priority
     
     # Custom fields
     custom_fields = {}
-    field_mappings = [
-        (client, "Clients"), (platform, "Platform"), 
-        (status, "Status"), (effort, "Effort")
-    ]
-    
-    for value, field_name in field_mappings:
-        if value and field_name in asana_custom_fields:
-            option_gid = get_custom_field_value(field_name, value)
-            if option_gid:
-                custom_fields[asana_custom_fields[field_name]] = option_gid
+    if client:
+        _add_custom_field(custom_fields, "Clients", client)
+    if platform:
+        _add_custom_field(custom_fields, "Platform", platform)
+    if status:
+        _add_custom_field(custom_fields, "Status", status)
+    if effort:
+        _add_custom_field(custom_fields, "Effort", effort)
     
     if custom_fields:
         task_data['custom_fields'] = custom_fields
+
+def _add_custom_field(custom_fields: dict, field_name: str, value: str) -> None:
+    """
+    Map a custom field value to its option GID and add it to custom_fields, if the field is configured.
+    """
+    field_gid = asana_custom_fields.get(field_name)
+    if field_gid:
+        option_gid = get_custom_field_value(field_name, value)
+        if option_gid:
+            custom_fields[field_gid] = option_gid
+
+class _TaskNameMatcher:
+    """
+    The one rule for finding tasks by name: a single exact (case-insensitive)
+    match wins, otherwise up to six partial matches, with duplicate GIDs ignored.
     
-    return task_data
+    Two tasks with the same exact name are ambiguous and both are reported, so
+    a name never silently resolves to whichever duplicate comes first. At most
+    five matches are ever shown; one extra marks the result as ambiguous.
+    """
+    
+    def __init__(self, query: str):
+        self._query = query.casefold()
+        self._seen = set()
+        self._partial_matches = []
+        self._exact_matches = []
+    
+    def add(self, task: dict) -> bool:
+        """
+        Consider one task; return True once a second exact match makes the result ambiguous.
+        """
+        if task['gid'] in self._seen:
+            return False
+        self._seen.add(task['gid'])
+        task_name = task['name'].casefold()
+        if task_name == self._query:
+            self._exact_matches.append(task)
+            return len(self._exact_matches) > 1
+        if self._query in task_name and len(self._partial_matches) < 6:
+            self._partial_matches.append(task)
+        return False
+    
+    @property
+    def matches(self) -> list:
+        return list(self._exact_matches or self._partial_matches)
+
+async def _find_project_tasks_by_name(query: str, project_gid: str) -> list:
+    """
+    Match a project's tasks by name over the async session (see _TaskNameMatcher).
+    
+    Pagination stops at a second exact match. Results are cached for a minute,
+    so a list-then-create sequence on one parent reads the project once.
+    """
+    key = (project_gid, query.casefold())
+    with _task_cache_lock:
+        cached = _task_name_cache.get(key)
+    if cached is not None:
+        return list(cached)
+    
+    matcher = _TaskNameMatcher(query)
+    async for task in _iter_asana(f"/projects/{project_gid}/tasks", params=_SEARCH_MATCH_OPTS):
+        if matcher.add(task):
+            break
+    matches = matcher.matches
+    
+    with _task_cache_lock:
+        _task_name_cache[key] = tuple(matches)
+    return matches
+
+async def _find_single_project_task(query: str, project: str, label: str = "task") -> tuple:
+    """
+    Find exactly one task in a project by name (see _find_project_tasks_by_name).
+    
+    Returns (task, error); on failure task is None and error is the message to return.
+    """
+    project_gid = await asyncio.to_thread(_resolve_project_gid, project)
+    matching_tasks = await _find_project_tasks_by_name(query, project_gid)
+    
+    if not matching_tasks:
+        return None, f"❌ No {label} found matching '{query}' in project '{project}'"
+    elif len(matching_tasks) > 1:
+        task_list = "\n".join([f"• {task['name']} (GID: {task['gid']})" for task in matching_tasks[:5]])
+        return None, f"❌ Multiple {label}s found:\n{task_list}\n\nPlease use a more specific name or the exact GID."
+    return matching_tasks[0], None
+
+# Absolute date formats, grouped by separator so only plausible formats are tried
+_DATE_FMTS_DASH = ('%Y-%m-%d', '%m-%d-%Y', '%m-%d-%y')
+_DATE_FMTS_SLASH = ('%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d', '%m/%d/%y')
 
 def _parse_due_date(due_date: str) -> str:
     """
@@ -343,9 +942,7 @@ def _parse_due_date(due_date: str) -> str:
     if not due_date:
         return ""
     
-    from datetime import datetime, timedelta
-    
-    # Handle relative dates
+    # Handle relative dates (never cached: they depend on the current day)
     if due_date.lower() in ['today', 'now']:
         return datetime.now().strftime('%Y-%m-%d')
     elif due_date.lower() == 'tomorrow':
@@ -357,8 +954,21 @@ def _parse_due_date(due_date: str) -> str:
         except ValueError:
             pass
     
-    # Try various date formats
-    for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%m-%d-%Y', '%d/%m/%Y', '%Y/%m/%d', '%m/%d/%y', '%m-%d-%y']:
+    return _parse_absolute_date(due_date)
+
+@functools.lru_cache(maxsize=256)
+def _parse_absolute_date(due_date: str) -> str:
+    """
+    Normalize an absolute date to YYYY-MM-DD, trying only the formats its separator allows.
+    """
+    if '/' in due_date:
+        formats = _DATE_FMTS_SLASH
+    elif '-' in due_date:
+        formats = _DATE_FMTS_DASH
+    else:
+        return due_date
+    
+    for fmt in formats:
         try:
             return datetime.strptime(due_date, fmt).strftime('%Y-%m-%d')
         except ValueError:
@@ -366,8 +976,43 @@ def _parse_due_date(due_date: str) -> str:
     
     return due_date  # Return as-is if no format matched
 
+def _failure(message: str, pretty: bool) -> Union[dict, str]:
+    """
+    Report a failed tool call as a structured error, or as the message itself when pretty.
+    """
+    return message if pretty else {'ok': False, 'error': message}
+
+def _task_summary(task: dict) -> dict:
+    """
+    Flatten an Asana task payload into the fields the tools report.
+    """
+    return {
+        'gid': task['gid'],
+        'name': task['name'],
+        'completed': task.get('completed'),
+        'due_on': task.get('due_on'),
+        'assignee': a['name'] if (a := task.get('assignee')) else None
+    }
+
+def format_task(task: dict) -> str:
+    """
+    Render a get_asana_task result for humans.
+    """
+    return f"""📋 Task Details:
+• ID: {task['gid']}
+• Name: {task['name']}
+• Completed: {'✅ Yes' if task['completed'] else '❌ No'}
+• Due Date: {task['due_on'] or 'Not set'}
+• Assignee: {task['assignee'] or 'Unassigned'}
+• Projects: {', '.join(task['projects'])}
+• Created: {task['created_at'] or 'N/A'}
+• Modified: {task['modified_at'] or 'N/A'}
+• URL: {task['url'] or 'N/A'}
+
+📝 Notes: {task['notes'] or 'No notes'}"""
+
 @mcp.tool()
-def create_asana_task(
+async def create_asana_task(
     name: str, 
     notes: str = "", 
     project: str = "", 
@@ -377,8 +1022,9 @@ def create_asana_task(
     client: str = "",
     platform: str = "",
     status: str = "",
-    effort: str = ""
-) -> str:
+    effort: str = "",
+    pretty: bool = False
+) -> Union[dict, str]:
     """
     Create a new task in Asana with intelligent assignee matching.
     
@@ -393,32 +1039,35 @@ def create_asana_task(
         platform: Platform name (optional)
         status: Status (optional)
         effort: Effort level (optional)
+        pretty: Return a human-readable message instead of structured data (default: False)
         
     Returns:
-        Success message with task details or error message
+        The created task's gid, name and url, or an error
     """
-    if not tasks_api:
-        return "Error: Asana client not initialized. Please check the access token."
-    
     try:
-        task_data = _build_task_data(
+        task_data = await asyncio.to_thread(
+            _build_create_task_data,
             name=name, notes=notes, project=project, assignee=assignee,
             due_date=due_date, priority=priority, client=client, 
             platform=platform, status=status, effort=effort
         )
         
-        result = tasks_api.create_task(
-            body={'data': task_data}, 
-            opts={'opt_fields': 'gid,name,permalink_url'}
+        result = await _batcher.submit(
+            "POST", "/tasks",
+            params=_CREATE_TASK_OPTS,
+            data=task_data
         )
+        _invalidate_task_names()
         
-        return f"✅ Task created successfully!\nTask ID: {result['gid']}\nName: {result['name']}\nURL: {result.get('permalink_url', 'N/A')}"
+        if pretty:
+            return f"✅ Task created successfully!\nTask ID: {result['gid']}\nName: {result['name']}\nURL: {result.get('permalink_url', 'N/A')}"
+        return {'ok': True, 'gid': result['gid'], 'name': result['name'], 'url': result.get('permalink_url')}
         
     except Exception as e:
-        return f"Error creating task: {str(e)}"
+        return _failure(f"Error creating task: {str(e)}", pretty)
 
 @mcp.tool()
-def update_asana_task(
+async def update_asana_task(
     task_name_or_gid: str,
     project: str = "",
     new_name: str = "",
@@ -430,8 +1079,9 @@ def update_asana_task(
     client: str = "",
     platform: str = "",
     status: str = "",
-    effort: str = ""
-) -> str:
+    effort: str = "",
+    pretty: bool = False
+) -> Union[dict, str]:
     """
     Update an existing Asana task. Can find task by name within a project or use direct GID.
     
@@ -448,150 +1098,258 @@ def update_asana_task(
         platform: Platform for the task (optional)
         status: Status for the task (optional)
         effort: Effort level for the task (optional)
+        pretty: Return a human-readable message instead of structured data (default: False)
         
     Available projects:
         - Analytics Team Status
         - Engineering (Data Solutions)
         
     Returns:
-        Success message with updated task details or error message
+        The updated task's gid, name and completion state, or an error
     """
-    if not tasks_api or not users_api:
-        return "Error: Asana client not initialized. Please check the access token."
-    
     try:
-        # Determine if we need to search for the task or if we have a direct GID
-        task_gid = None
-        
-        # If it looks like a GID (long number), use it directly
-        if task_name_or_gid.isdigit() and len(task_name_or_gid) > 10:
-            task_gid = task_name_or_gid
-        else:
+        # Helper coroutine to find the task GID, returning (gid, error)
+        async def find_task_gid():
+            # If it looks like a GID (long number), use it directly
+            if _is_gid(task_name_or_gid):
+                return task_name_or_gid, None
+            
             # Search for the task by name within the project
             if not project:
-                return "Error: Project name or GID is required when searching by task name."
+                return None, "Error: Project name or GID is required when searching by task name."
             
             # Get project GID from name mapping if needed
-            project_gid = asana_projects.get(project, project)
-            
-            # Get user's workspace to search in
-            workspace_gid = WORKSPACE_GID
-            
-            # Get all tasks from the project and filter by name
-            tasks = tasks_api.get_tasks_for_project(
-                project_gid=project_gid,
-                opts={'opt_fields': 'name,gid,completed'}
-            )
+            project_gid = await asyncio.to_thread(_resolve_project_gid, project)
             
-            # Find exact match or best match
-            matching_tasks = []
-            for task in tasks:
-                if task['name'].lower() == task_name_or_gid.lower():
-                    matching_tasks.append(task)
-                elif task_name_or_gid.lower() in task['name'].lower():
-                    matching_tasks.append(task)
+            # Single pass over the project's tasks: stop once the name is ambiguous
+            matching_tasks = await _find_project_tasks_by_name(task_name_or_gid, project_gid)
             
             if not matching_tasks:
-                return f"❌ No tasks found matching '{task_name_or_gid}' in project '{project}'"
+                return None, f"❌ No tasks found matching '{task_name_or_gid}' in project '{project}'"
             elif len(matching_tasks) > 1:
                 task_list = "\n".join([f"• {task['name']} (GID: {task['gid']})" for task in matching_tasks[:5]])
-                return f"❌ Multiple tasks found matching '{task_name_or_gid}':\n{task_list}\n\nPlease use a more specific name or the exact GID."
+                return None, f"❌ Multiple tasks found matching '{task_name_or_gid}':\n{task_list}\n\nPlease use a more specific name or the exact GID."
             else:
-                task_gid = matching_tasks[0]['gid']
-                print(f"✅ Found task: {matching_tasks[0]['name']} (GID: {task_gid})")
+                log.debug("Found task: %s (GID: %s)", matching_tasks[0]['name'], matching_tasks[0]['gid'])
+                return matching_tasks[0]['gid'], None
         
-        # Build update data using shared function
-        task_data = _build_task_data(
-            new_name=new_name, notes=notes, assignee=assignee, due_date=due_date,
-            priority=priority, client=client, platform=platform, 
-            status=status, effort=effort, completed=completed
+        # Find the task and build the update data concurrently; neither depends on the other
+        (task_gid, error), task_data = await asyncio.gather(
+            find_task_gid(),
+            asyncio.to_thread(
+                _build_update_task_data,
+                new_name=new_name, notes=notes, assignee=assignee, due_date=due_date,
+                priority=priority, client=client, platform=platform, 
+                status=status, effort=effort, completed=completed
+            )
         )
+        if error:
+            return _failure(error, pretty)
         
         if not task_data:
-            return "Error: No fields provided to update. Please specify at least one field to update."
+            return _failure("Error: No fields provided to update. Please specify at least one field to update.", pretty)
         
         # Update the task
-        result = tasks_api.update_task(
-            body={'data': task_data}, 
-            task_gid=task_gid, 
-            opts={'opt_fields': 'gid,name,completed'}
+        result = await _batcher.submit(
+            "PUT", f"/tasks/{task_gid}",
+            params=_UPDATE_TASK_OPTS,
+            data=task_data
         )
+        _invalidate_task(task_gid)
         
-        return f"✅ Task updated successfully!\nTask ID: {result['gid']}\nName: {result['name']}\nCompleted: {result['completed']}"
+        if pretty:
+            return f"✅ Task updated successfully!\nTask ID: {result['gid']}\nName: {result['name']}\nCompleted: {result['completed']}"
+        return {'ok': True, 'gid': result['gid'], 'name': result['name'], 'completed': result['completed']}
         
     except Exception as e:
-        return f"Error updating task: {str(e)}"
+        return _failure(f"Error updating task: {str(e)}", pretty)
 
 @mcp.tool()
-def get_asana_task(task_gid: str) -> str:
+async def update_multiple_asana_tasks(
+    task_gids: str,
+    notes: str = "",
+    completed: str = "",
+    due_date: str = "",
+    assignee: str = "",
+    priority: str = "",
+    client: str = "",
+    platform: str = "",
+    status: str = "",
+    effort: str = "",
+    pretty: bool = False
+) -> Union[dict, str]:
     """
-    Get details of an Asana task.
+    Apply the same update to several Asana tasks at once (sent as batched API calls).
     
     Args:
-        task_gid: The GID of the task to retrieve
+        task_gids: Comma-separated or newline-separated list of task GIDs
+        notes: New description for the tasks (optional)
+        completed: Mark tasks as completed - 'true' or 'false' (optional)
+        due_date: New due date in various formats - YYYY-MM-DD, MM/DD/YYYY, 'today', 'tomorrow', '5 days' (optional)
+        assignee: Full name, partial name, email, or GID (optional)
+        priority: New priority - 'low', 'medium', 'high', or 'urgent' (optional)
+        client: Client name for the tasks (optional)
+        platform: Platform for the tasks (optional)
+        status: Status for the tasks (optional)
+        effort: Effort level for the tasks (optional)
+        pretty: Return a human-readable summary instead of structured data (default: False)
         
     Returns:
-        Task details or error message
+        The updated and failed tasks, or an error
     """
-    if not tasks_api:
-        return "Error: Asana client not initialized. Please check the access token."
-    
     try:
-        result = tasks_api.get_task(
-            task_gid=task_gid,
-            opts={'opt_fields': 'name,notes,completed,due_on,created_at,modified_at,assignee.name,projects.name,permalink_url'}
+        # Parse the task list
+        if '\n' in task_gids:
+            gids = [gid.strip() for gid in task_gids.split('\n') if gid.strip()]
+        else:
+            gids = [gid.strip() for gid in task_gids.split(',') if gid.strip()]
+        
+        if not gids:
+            return _failure("Error: No task GIDs provided. Please provide a comma-separated or newline-separated list.", pretty)
+        
+        # Build the shared update data once
+        task_data = await asyncio.to_thread(
+            _build_update_task_data,
+            notes=notes, assignee=assignee, due_date=due_date,
+            priority=priority, client=client, platform=platform,
+            status=status, effort=effort, completed=completed
         )
         
-        task_info = f"""📋 Task Details:
-• ID: {result['gid']}
-• Name: {result['name']}
-• Completed: {'✅ Yes' if result['completed'] else '❌ No'}
-• Due Date: {result.get('due_on', 'Not set')}
-• Assignee: {result.get('assignee', {}).get('name', 'Unassigned')}
-• Projects: {', '.join([p['name'] for p in result.get('projects', [])])}
-• Created: {result.get('created_at', 'N/A')}
-• Modified: {result.get('modified_at', 'N/A')}
-• URL: {result.get('permalink_url', 'N/A')}
-
-📝 Notes: {result.get('notes', 'No notes')}"""
+        if not task_data:
+            return _failure("Error: No fields provided to update. Please specify at least one field to update.", pretty)
+        
+        # Only real GIDs go into the request path; anything else is reported without a request
+        failed_tasks = [{'gid': gid, 'error': "Not a valid task GID"} for gid in gids if not _is_gid(gid)]
+        gids = [gid for gid in gids if _is_gid(gid)]
+        
+        # Submit every update at once so they are coalesced into /batch calls
+        results = await asyncio.gather(
+            *[
+                _batcher.submit(
+                    "PUT", f"/tasks/{gid}",
+                    params=_TASK_REF_OPTS,
+                    data=task_data
+                )
+                for gid in gids
+            ],
+            return_exceptions=True
+        )
+        
+        updated_tasks = []
+        for gid, result in zip(gids, results):
+            if isinstance(result, Exception):
+                failed_tasks.append({'gid': gid, 'error': str(result)})
+            else:
+                _invalidate_task(gid)
+                updated_tasks.append({'gid': result['gid'], 'name': result['name']})
+        
+        if not pretty:
+            return {'ok': not failed_tasks, 'updated': updated_tasks, 'failed': failed_tasks}
+        
+        # Build result summary
+        parts = ["📋 **Bulk Update Summary**\n\n"]
         
-        return task_info
+        if updated_tasks:
+            parts.append(f"**✅ Successfully Updated ({len(updated_tasks)}):**\n")
+            parts.append("\n".join(f"✅ {task['name']} (ID: {task['gid']})" for task in updated_tasks) + "\n\n")
+        
+        if failed_tasks:
+            parts.append(f"**❌ Failed ({len(failed_tasks)}):**\n")
+            parts.append("\n".join(f"❌ {task['gid']}: {task['error']}" for task in failed_tasks) + "\n\n")
+        
+        parts.append(f"**Total:** {len(updated_tasks)} updated, {len(failed_tasks)} failed")
+        
+        return ''.join(parts)
         
     except Exception as e:
-        return f"Error retrieving task: {str(e)}"
+        return _failure(f"Error updating multiple tasks: {str(e)}", pretty)
 
 @mcp.tool()
-def list_asana_projects() -> str:
+async def get_asana_task(task_gid: str, pretty: bool = False) -> Union[dict, str]:
     """
-    List all projects accessible to the authenticated user.
+    Get details of an Asana task.
     
+    Args:
+        task_gid: The GID of the task to retrieve
+        pretty: Return a human-readable summary instead of structured data (default: False)
+        
     Returns:
-        List of projects with their GIDs and names or error message
+        Task details or an error
     """
-    if not projects_api or not users_api:
-        return "Error: Asana client not initialized. Please check the access token."
-    
     try:
-        # Get the authenticated user first
-        me = users_api.get_user(user_gid='me', opts={'opt_fields': 'gid,workspaces'})
+        # Checked before the cache and the request path, so nothing else is ever fetched or cached
+        task_gid = task_gid.strip()
+        if not _is_gid(task_gid):
+            return _failure(f"Error retrieving task: '{task_gid}' is not a valid task GID", pretty)
+        
+        with _task_cache_lock:
+            result = _task_cache.get(task_gid)
+        if result is None:
+            result = await _batcher.submit(
+                "GET", f"/tasks/{task_gid}",
+                params=_GET_TASK_OPTS
+            )
+            with _task_cache_lock:
+                _task_cache[task_gid] = result
         
-        # Get projects for the user
-        projects = projects_api.get_projects(
-            opts={'opt_fields': 'name,gid,created_at,modified_at'},
-            workspace=me['workspaces'][0]['gid']
-        )
+        task = {
+            **_task_summary(result),
+            'projects': [p['name'] for p in result.get('projects', [])],
+            'created_at': result.get('created_at'),
+            'modified_at': result.get('modified_at'),
+            'notes': result.get('notes'),
+            'url': result.get('permalink_url')
+        }
+        
+        return format_task(task) if pretty else {'ok': True, **task}
+        
+    except Exception as e:
+        return _failure(f"Error retrieving task: {str(e)}", pretty)
+
+@mcp.tool()
+async def list_asana_projects(limit: int = 50, pretty: bool = False) -> Union[dict, str]:
+    """
+    List projects accessible to the authenticated user.
+    
+    Args:
+        limit: Maximum number of projects to return (default: 50); pass a larger value only when needed
+        pretty: Return a human-readable list instead of structured data (default: False)
+    
+    Returns:
+        Projects with their GIDs and names, or an error
+    """
+    try:
+        limit = max(limit, 1)
+        projects = _projects_cache.get(limit)
+        if projects is None:
+            # Get the authenticated user's workspace (cached after the first call)
+            workspace_gid = await _get_default_workspace_gid()
+            
+            # Get projects for the user, stopping pagination once we have enough
+            projects = []
+            async for project in _iter_asana(
+                "/projects",
+                params={**_LIST_PROJECT_OPTS, 'workspace': workspace_gid, 'limit': min(limit, 100)}
+            ):
+                projects.append(project)
+                if len(projects) >= limit:
+                    break
+            _projects_cache[limit] = projects
+        
+        if not pretty:
+            return {'ok': True, 'projects': [{'gid': p['gid'], 'name': p['name']} for p in projects]}
         
         if not projects:
             return "No projects found."
         
-        project_list = "📁 Your Asana Projects:\n\n"
+        parts = ["📁 Your Asana Projects:\n\n"]
         for project in projects:
-            project_list += f"• {project['name']} (GID: {project['gid']})\n"
+            parts.append(f"• {project['name']} (GID: {project['gid']})\n")
         
-        return project_list
+        return ''.join(parts)
         
     except Exception as e:
-        return f"Error listing projects: {str(e)}"
+        return _failure(f"Error listing projects: {str(e)}", pretty)
 
 @mcp.tool()
 def list_available_projects() -> str:
@@ -601,16 +1359,23 @@ def list_available_projects() -> str:
     Returns:
         List of available project names that can be used in other functions
     """
+    return _render_available_projects()
+
+@functools.lru_cache(maxsize=1)
+def _render_available_projects() -> str:
+    """
+    Render the local project mapping once; asana_projects is never mutated at runtime.
+    """
     if not asana_projects:
         return "No project mappings configured."
     
-    project_list = "📋 Available Projects (you can use these names in other functions):\n\n"
+    parts = ["📋 Available Projects (you can use these names in other functions):\n\n"]
     for project_name, project_gid in asana_projects.items():
-        project_list += f"• **{project_name}**\n  GID: {project_gid}\n\n"
+        parts.append(f"• **{project_name}**\n  GID: {project_gid}\n\n")
     
-    project_list += "💡 You can use either the project name or GID in create_asana_task and search_asana_tasks functions."
+    parts.append("💡 You can use either the project name or GID in create_asana_task and search_asana_tasks functions.")
     
-    return project_list
+    return ''.join(parts)
 
 
 @mcp.tool()
@@ -621,19 +1386,19 @@ def list_custom_field_options() -> str:
     Returns:
         List of available options for each custom field
     """
-    options_info = "📋 Available Custom Field Options:\n\n"
+    parts = ["📋 Available Custom Field Options:\n\n"]
     
     for field_name, field_options in asana_field_options.items():
-        options_info += f"**{field_name.title()}:**\n"
+        parts.append(f"**{field_name.title()}:**\n")
         if field_options:
             for option_name, option_gid in field_options.items():
                 configured = "✅" if not option_gid.startswith("REPLACE_") else "❌"
-                options_info += f"  {configured} {option_name}\n"
+                parts.append(f"  {configured} {option_name}\n")
         else:
-            options_info += "  No options configured\n"
-        options_info += "\n"
+            parts.append("  No options configured\n")
+        parts.append("\n")
     
-    options_info += """💡 **Usage Examples:**
+    parts.append("""💡 **Usage Examples:**
 • create_asana_task("Fix bug", client="acme corp", platform="web")
 • update_asana_task("Fix bug", project="Engineering", client="tech solutions")
 
@@ -641,12 +1406,12 @@ def list_custom_field_options() -> str:
 ❌ = Option GID needs to be configured
 ✅ = Option GID is configured
 
-To configure option GIDs, replace the placeholder values in asana_field_options dictionary."""
+To configure option GIDs, replace the placeholder values in asana_field_options dictionary.""")
     
-    return options_info
+    return ''.join(parts)
 
 @mcp.tool()
-def find_team_member_gid(full_name: str) -> str:
+async def find_team_member_gid(full_name: str) -> str:
     """
     Search for a team member by their full name and return their GID.
     
@@ -656,9 +1421,6 @@ def find_team_member_gid(full_name: str) -> str:
     Returns:
         The team member's GID and details, or error message if not found
     """
-    if not users_api:
-        return "Error: Asana client not initialized. Please check the access token."
-    
     if not full_name or not full_name.strip():
         return "Error: Please provide a name to search for."
     
@@ -666,7 +1428,7 @@ def find_team_member_gid(full_name: str) -> str:
         # Force refresh cache to get latest users
         global _cache_timestamp
         _cache_timestamp = None  # Force refresh
-        user_cache = _fetch_workspace_users()
+        user_cache = await asyncio.to_thread(_fetch_workspace_users)
         
         if not user_cache:
             return "❌ Unable to fetch team members from workspace. Please check your Asana access token and permissions."
@@ -674,61 +1436,47 @@ def find_team_member_gid(full_name: str) -> str:
         search_name = full_name.lower().strip()
         
         # Try exact match first
-        if search_name in user_cache:
-            gid = user_cache[search_name]
+        if search_name in user_cache or search_name in _user_gids:
+            gid = user_cache.get(search_name, search_name)
             return f"✅ **Found exact match!**\nName: {full_name}\nGID: {gid}\n\nYou can now use '{full_name}' as assignee in create_asana_task() and update_asana_task()."
         
         # Try partial matches
         matches = []
         for cached_name, gid in user_cache.items():
-            if cached_name == gid:  # Skip GID entries
-                continue
             if search_name in cached_name or cached_name in search_name:
                 matches.append((cached_name, gid))
         
         if matches:
-            result = f"🔍 **Found {len(matches)} potential match(es) for '{full_name}':**\n\n"
+            parts = [f"🔍 **Found {len(matches)} potential match(es) for '{full_name}':**\n\n"]
             for cached_name, gid in matches[:5]:  # Show top 5 matches
-                result += f"• **{cached_name.title()}** → GID: {gid}\n"
+                parts.append(f"• **{cached_name.title()}** → GID: {gid}\n")
             
             if len(matches) == 1:
-                result += f"\n✅ **Best match:** {matches[0][0].title()}\nGID: {matches[0][1]}\n"
+                parts.append(f"\n✅ **Best match:** {matches[0][0].title()}\nGID: {matches[0][1]}\n")
             
-            return result
+            return ''.join(parts)
         else:
             # Show available team members for reference
-            result = f"❌ **No matches found for '{full_name}'**\n\n📋 **Available team members:**\n"
-            
-            # Get actual user details for display
-            workspace_gid = WORKSPACE_GID
-            users_response = users_api.get_users_for_workspace(
-                workspace_gid=workspace_gid,
-                opts={'opt_fields': 'gid,name,email'}
-            )
+            parts = [f"❌ **No matches found for '{full_name}'**\n\n📋 **Available team members:**\n"]
             
-            # Handle response format
-            if isinstance(users_response, dict) and 'data' in users_response:
-                users = users_response['data']
-            elif isinstance(users_response, list):
-                users = users_response
-            else:
-                users = [users_response] if users_response else []
+            # Reuse the user details fetched with the cache
+            users = _user_records
             
             for user in users[:10]:  # Show first 10 users
                 name = user.get('name', 'No name')
                 gid = user.get('gid', '')
-                result += f"• **{name}** (GID: {gid})\n"
+                parts.append(f"• **{name}** (GID: {gid})\n")
             
             if len(users) > 10:
-                result += f"... and {len(users) - 10} more team members\n"
+                parts.append(f"... and {len(users) - 10} more team members\n")
             
-            return result
+            return ''.join(parts)
         
     except Exception as e:
         return f"Error searching for team member: {str(e)}"
 
 @mcp.tool()
-def test_assignee_resolution(test_name: str) -> str:
+async def test_assignee_resolution(test_name: str) -> str:
     """
     Test the assignee resolution system with various name formats.
     
@@ -738,14 +1486,12 @@ def test_assignee_resolution(test_name: str) -> str:
     Returns:
         Resolution result showing what GID would be used
     """
-    if not users_api:
-        return "Error: Asana client not initialized. Please check the access token."
-    
     try:
-        resolved_gid = resolve_assignee(test_name)
+        # Resolve off the event loop; a cold user cache means a workspace fetch
+        resolved_gid = await asyncio.to_thread(resolve_assignee, test_name)
         
         # Get user cache to show available options
-        user_cache = _fetch_workspace_users()
+        user_cache = await asyncio.to_thread(_fetch_workspace_users)
         
         result = f"🔍 **Testing assignee resolution for: '{test_name}'**\n\n"
         result += f"✅ **Resolved to GID:** {resolved_gid}\n\n"
@@ -753,7 +1499,7 @@ def test_assignee_resolution(test_name: str) -> str:
         # Show if we found a match in cache
         found_match = False
         for cached_key, gid in user_cache.items():
-            if gid == resolved_gid and cached_key != gid:
+            if gid == resolved_gid:
                 result += f"📝 **Matched against:** {cached_key}\n"
                 found_match = True
                 break
@@ -766,11 +1512,7 @@ def test_assignee_resolution(test_name: str) -> str:
         result += "\n💡 **Available team members for reference:**\n"
         
         # Show first few team members as examples
-        workspace_gid = WORKSPACE_GID
-        users = users_api.get_users_for_workspace(
-            workspace_gid=workspace_gid,
-            opts={'opt_fields': 'gid,name,email'}
-        )
+        users = _user_records
         
         for i, user in enumerate(users[:3]):  # Show first 3 users
             name = user.get('name', 'No name')
@@ -788,89 +1530,79 @@ def test_assignee_resolution(test_name: str) -> str:
     except Exception as e:
         return f"Error testing assignee resolution: {str(e)}"
 
+@functools.lru_cache(maxsize=4096)
+def _format_team_member(gid: str, name: str, email: str) -> str:
+    """
+    Render one get_team_members entry; memoized because membership rarely changes between calls.
+    """
+    short_forms = ""
+    if name and name != 'No name':
+        name_parts = name.split()
+        if len(name_parts) >= 2:
+            short_forms = f"  • Short form: \"{name_parts[0]} {name_parts[-1][0]}\"\n  • First name: \"{name_parts[0]}\"\n"
+    
+    email_line = f"  • Email: \"{email}\"\n" if email and email != 'No email' else ""
+    
+    return f"**{name}**\n  • Full name: \"{name}\"\n{short_forms}{email_line}  • GID: {gid}\n\n"
+
 @mcp.tool()
-def get_team_members() -> str:
+async def get_team_members() -> str:
     """
     Get team members from your workspace with intelligent name matching.
     
     Returns:
         List of team members showing how they can be referenced
     """
-    if not users_api:
-        return "Error: Asana client not initialized. Please check the access token."
-    
     try:
         # Force refresh cache and get users
         global _cache_timestamp
         _cache_timestamp = None  # Force refresh
-        user_cache = _fetch_workspace_users()
+        user_cache = await asyncio.to_thread(_fetch_workspace_users)
         
         if not user_cache:
             return "❌ No team members found or unable to fetch from workspace. Please check your Asana access token and permissions."
         
-        # Get actual user details
+        # Reuse the user details fetched with the cache
         workspace_gid = WORKSPACE_GID
-        users_response = users_api.get_users_for_workspace(
-            workspace_gid=workspace_gid,
-            opts={'opt_fields': 'gid,name,email'}
-        )
-        
-        # Handle response format
-        if isinstance(users_response, dict) and 'data' in users_response:
-            users = users_response['data']
-        elif isinstance(users_response, list):
-            users = users_response
-        else:
-            users = [users_response] if users_response else []
+        users = _user_records
         
         if not users:
             return f"❌ No users found in workspace {workspace_gid}. Please check your permissions."
         
-        result = f"👥 **Team Members ({len(users)} found):**\n\n"
+        parts = [f"👥 **Team Members ({len(users)} found):**\n\n"]
         
         for user in users:
             if not isinstance(user, dict):
                 continue
                 
-            name = user.get('name', 'No name')
-            email = user.get('email', 'No email')
-            gid = user.get('gid', 'No GID')
-            
-            result += f"**{name}**\n"
-            result += f"  • Full name: \"{name}\"\n"
-            
-            if name and name != 'No name':
-                name_parts = name.split()
-                if len(name_parts) >= 2:
-                    result += f"  • Short form: \"{name_parts[0]} {name_parts[-1][0]}\"\n"
-                    result += f"  • First name: \"{name_parts[0]}\"\n"
-            
-            if email and email != 'No email':
-                result += f"  • Email: \"{email}\"\n"
-            
-            result += f"  • GID: {gid}\n\n"
-        
-        result += "💡 **Usage Examples:**\n"
-        result += '• create_asana_task("Fix bug", assignee="John Doe")\n'
-        result += '• create_asana_task("Fix bug", assignee="John D")\n'
-        result += '• create_asana_task("Fix bug", assignee="John")\n'
-        result += '• create_asana_task("Fix bug", assignee="john@company.com")\n\n'
-        result += f'📋 **Workspace Info:** {workspace_gid}\n'
-        result += f'💾 **Cache Status:** {len(user_cache)} entries cached\n\n'
-        result += '💡 **Find a specific GID:** Use find_team_member_gid("Full Name") to search for someone specific.\n'
-        result += '💡 **Test the resolution:** Use test_assignee_resolution("Your Name") to see how names are matched.\n'
-        result += '📝 **Create subtasks:** Use create_subtask() or create_multiple_subtasks() to add subtasks under existing tasks.\n'
-        result += '🔗 **Dependencies:** Use add_task_dependency() or create_subtasks_with_dependencies() for task sequencing.\n'
-        result += '🔄 **Move tasks:** Use move_task_to_project() or move_multiple_tasks() to move tasks between projects.\n'
+            parts.append(_format_team_member(
+                user.get('gid', 'No GID'), user.get('name', 'No name'), user.get('email', 'No email')
+            ))
+        
+        parts.append(f"""💡 **Usage Examples:**
+• create_asana_task("Fix bug", assignee="John Doe")
+• create_asana_task("Fix bug", assignee="John D")
+• create_asana_task("Fix bug", assignee="John")
+• create_asana_task("Fix bug", assignee="john@company.com")
+
+📋 **Workspace Info:** {workspace_gid}
+💾 **Cache Status:** {len(user_cache)} entries cached
+
+💡 **Find a specific GID:** Use find_team_member_gid("Full Name") to search for someone specific.
+💡 **Test the resolution:** Use test_assignee_resolution("Your Name") to see how names are matched.
+📝 **Create subtasks:** Use create_subtask() or create_multiple_subtasks() to add subtasks under existing tasks.
+🔗 **Dependencies:** Use add_task_dependency() or create_subtasks_with_dependencies() for task sequencing.
+🔄 **Move tasks:** Use move_task_to_project() or move_multiple_tasks() to move tasks between projects.
+""")
         
-        return result
+        return ''.join(parts)
         
     except Exception as e:
         return f"Error getting team members: {str(e)}"
 
 
 @mcp.tool()
-def search_asana_tasks(query: str, project: str = "", completed: str = "false") -> str:
+async def search_asana_tasks(query: str, project: str = "", completed: str = "false", limit: int = 50, pretty: bool = False) -> Union[dict, str]:
     """
     Search for tasks in Asana.
     
@@ -878,59 +1610,96 @@ def search_asana_tasks(query: str, project: str = "", completed: str = "false")
         query: Search query to find tasks
         project: Project name (e.g. "Analytics Team Status") or GID to limit search to (optional)
         completed: Include completed tasks - 'true' or 'false' (default: 'false')
+        limit: Maximum number of matching tasks to return (default: 50)
+        pretty: Return a human-readable list instead of structured data (default: False)
         
     Available projects:
         - Analytics Team Status
         - Engineering (Data Solutions)
         
     Returns:
-        List of matching tasks or error message
+        Matching tasks or an error
     """
-    if not tasks_api or not users_api:
-        return "Error: Asana client not initialized. Please check the access token."
-    
     try:
-        # Get user's workspace
-        workspace_gid = WORKSPACE_GID
+        limit = max(limit, 1)
         
         # Get tasks from project if specified, otherwise search workspace
         if project:
-            # Check if project is a name in our mapping, otherwise use as GID
-            project_gid = asana_projects.get(project, project)
-            tasks = tasks_api.get_tasks_for_project(
-                project_gid=project_gid,
-                opts={'opt_fields': 'name,gid,completed,due_on,assignee.name'}
-            )
-            # Filter by query text and completion status
+            # Check if project is a known name, otherwise use as GID
+            project_gid = await asyncio.to_thread(_resolve_project_gid, project)
+            params = dict(_SEARCH_OPTS)
+            if completed.lower() != 'true':
+                # Let Asana drop completed tasks instead of downloading and discarding them
+                params['completed_since'] = 'now'
+            tasks = _iter_asana(f"/projects/{project_gid}/tasks", params=params)
+            # Filter by query text and completion status, stopping once we have enough
             filtered_tasks = []
-            for task in tasks:
+            async for task in tasks:
                 name_matches = query.lower() in task.get('name', '').lower()
-                status_matches = task.get('completed', False) == (completed.lower() == 'true')
                 if name_matches and (completed.lower() == 'true' or not task.get('completed', False)):
                     filtered_tasks.append(task)
+                    if len(filtered_tasks) >= limit:
+                        break
             tasks = filtered_tasks
         else:
             # For workspace-wide search, we'll need to iterate through projects
             # This is a limitation - for now, require a project
-            return "Error: Please specify a project to search within."
+            return _failure("Error: Please specify a project to search within.", pretty)
+        
+        tasks = [_task_summary(task) for task in tasks]
+        if not pretty:
+            return {'ok': True, 'query': query, 'tasks': tasks}
         
         if not tasks:
             return f"No tasks found matching '{query}'."
         
-        task_list = f"🔍 Search Results for '{query}':\n\n"
+        parts = [f"🔍 Search Results for '{query}':\n\n"]
         for task in tasks:
-            status = "✅" if task['completed'] else "❌"
-            due = task.get('due_on', 'No due date')
-            assignee = task.get('assignee', {}).get('name', 'Unassigned')
-            task_list += f"{status} {task['name']} (GID: {task['gid']})\n   Due: {due} | Assigned to: {assignee}\n\n"
+            status = _STATUS_ICONS[bool(task['completed'])]
+            due = task['due_on'] or 'No due date'
+            assignee = task['assignee'] or 'Unassigned'
+            parts.append(f"{status} {task['name']} (GID: {task['gid']})\n   Due: {due} | Assigned to: {assignee}\n\n")
         
-        return task_list
+        return ''.join(parts)
         
     except Exception as e:
-        return f"Error searching tasks: {str(e)}"
+        return _failure(f"Error searching tasks: {str(e)}", pretty)
+
+async def _resolve_parent(parent_task_name_or_gid: str, project: str, fetch_name: bool = True) -> tuple:
+    """
+    Resolve a parent task name or GID for the subtask tools.
+    
+    Returns (gid, name, error); on failure gid is None and error is the message to
+    return. For a GID the name is only fetched when fetch_name is set.
+    """
+    if _is_gid(parent_task_name_or_gid):
+        if not fetch_name:
+            return parent_task_name_or_gid, "", None
+        try:
+            parent_info = await _batcher.submit(
+                "GET", f"/tasks/{parent_task_name_or_gid}",
+                params=_NAME_OPTS
+            )
+            parent_task_name = parent_info.get('name', 'Unknown')
+        except Exception:
+            parent_task_name = 'Unknown'
+        return parent_task_name_or_gid, parent_task_name, None
+    
+    if not project:
+        return None, "", "Error: Project name or GID is required when searching by task name."
+    
+    project_gid = await asyncio.to_thread(_resolve_project_gid, project)
+    matching_tasks = await _find_project_tasks_by_name(parent_task_name_or_gid, project_gid)
+    
+    if not matching_tasks:
+        return None, "", f"❌ No parent task found matching '{parent_task_name_or_gid}' in project '{project}'"
+    elif len(matching_tasks) > 1:
+        task_list = "\n".join([f"• {task['name']} (GID: {task['gid']})" for task in matching_tasks[:5]])
+        return None, "", f"❌ Multiple parent tasks found:\n{task_list}\n\nPlease use a more specific name or the exact GID."
+    return matching_tasks[0]['gid'], matching_tasks[0]['name'], None
 
 @mcp.tool()
-def create_subtask(
+async def create_subtask(
     parent_task_name_or_gid: str,
     subtask_name: str,
     project: str = "",
@@ -962,52 +1731,15 @@ def create_subtask(
     Returns:
         Success message with subtask details or error message
     """
-    if not tasks_api or not users_api:
-        return "Error: Asana client not initialized. Please check the access token."
-    
     try:
         # Find the parent task
-        parent_task_gid = None
-        
-        # If it looks like a GID, use it directly
-        if parent_task_name_or_gid.isdigit() and len(parent_task_name_or_gid) > 10:
-            parent_task_gid = parent_task_name_or_gid
-        else:
-            # Search for the parent task by name
-            if not project:
-                return "Error: Project name or GID is required when searching by task name."
-            
-            project_gid = asana_projects.get(project, project)
-            workspace_gid = WORKSPACE_GID
-            
-            tasks = tasks_api.get_tasks_for_project(
-                project_gid=project_gid,
-                opts={'opt_fields': 'name,gid'}
-            )
-            
-            # Handle response format
-            if isinstance(tasks, dict) and 'data' in tasks:
-                tasks = tasks['data']
-            elif not isinstance(tasks, list):
-                tasks = [tasks] if tasks else []
-            
-            matching_tasks = []
-            for task in tasks:
-                if task['name'].lower() == parent_task_name_or_gid.lower():
-                    matching_tasks.append(task)
-                elif parent_task_name_or_gid.lower() in task['name'].lower():
-                    matching_tasks.append(task)
-            
-            if not matching_tasks:
-                return f"❌ No parent task found matching '{parent_task_name_or_gid}' in project '{project}'"
-            elif len(matching_tasks) > 1:
-                task_list = "\n".join([f"• {task['name']} (GID: {task['gid']})" for task in matching_tasks[:5]])
-                return f"❌ Multiple parent tasks found:\n{task_list}\n\nPlease use a more specific name or the exact GID."
-            else:
-                parent_task_gid = matching_tasks[0]['gid']
+        parent_task_gid, _, error = await _resolve_parent(parent_task_name_or_gid, project, fetch_name=False)
+        if error:
+            return error
         
         # Create the subtask with proper parent relationship
-        subtask_data = _build_task_data(
+        subtask_data = await asyncio.to_thread(
+            _build_create_task_data,
             name=subtask_name, notes=notes, assignee=assignee, due_date=due_date,
             priority=priority, client=client, platform=platform, 
             status=status, effort=effort
@@ -1017,24 +1749,24 @@ def create_subtask(
         subtask_data['parent'] = parent_task_gid
         
         # Create the subtask
-        result = tasks_api.create_task(
-            body={'data': subtask_data}, 
-            opts={'opt_fields': 'gid,name,parent.name,permalink_url'}
+        result = await _batcher.submit(
+            "POST", "/tasks",
+            params=_CREATE_TASK_OPTS,
+            data=subtask_data
         )
         
         # Verify the parent relationship was established
         try:
             # Get the created subtask to confirm parent relationship
-            subtask_info = tasks_api.get_task(
-                task_gid=result['gid'],
-                opts={'opt_fields': 'gid,name,parent.name,parent.gid'}
+            subtask_info = await _batcher.submit(
+                "GET", f"/tasks/{result['gid']}",
+                params=_PARENT_OPTS
             )
-            parent_info = subtask_info.get('parent', {})
-            if parent_info:
+            if parent_info := subtask_info.get('parent'):
                 parent_verification = f"\n🔗 **Parent Relationship:** ✅ Confirmed\n   Parent: {parent_info.get('name', 'Unknown')} (GID: {parent_info.get('gid', 'Unknown')})\n"
             else:
                 parent_verification = "\n⚠️ **Warning:** Parent relationship may not have been established properly.\n"
-        except:
+        except Exception:
             parent_verification = "\n⚠️ **Warning:** Could not verify parent relationship.\n"
         
         return f"✅ Subtask created successfully!\nSubtask: {result['name']}\nSubtask ID: {result['gid']}\nURL: {result.get('permalink_url', 'N/A')}{parent_verification}"
@@ -1042,8 +1774,72 @@ def create_subtask(
     except Exception as e:
         return f"Error creating subtask: {str(e)}"
 
-@mcp.tool()
-def create_multiple_subtasks(
+def _longest_ordered_ranks(ranks: list) -> set:
+    """
+    Return the ranks forming a longest increasing subsequence of ranks (patience sorting).
+    """
+    tail_values, tail_indices = [], []
+    previous = [None] * len(ranks)
+    for i, rank in enumerate(ranks):
+        pos = bisect.bisect_left(tail_values, rank)
+        if pos:
+            previous[i] = tail_indices[pos - 1]
+        if pos == len(tail_values):
+            tail_values.append(rank)
+            tail_indices.append(i)
+        else:
+            tail_values[pos] = rank
+            tail_indices[pos] = i
+    
+    kept = set()
+    i = tail_indices[-1] if tail_indices else None
+    while i is not None:
+        kept.add(ranks[i])
+        i = previous[i]
+    return kept
+
+async def _keep_subtask_order(parent_task_gid: str, subtask_gids: list) -> None:
+    """
+    Make newly created subtasks appear under their parent in the given order.
+    
+    Concurrent creates can land in any order. The longest run already in order stays
+    put and only the other subtasks are moved with setParent. Each stretch of moved
+    subtasks is anchored on one that stays, so stretches move concurrently while
+    the subtasks within a stretch move one after another.
+    """
+    rank = {gid: i for i, gid in enumerate(subtask_gids)}
+    current = [
+        rank[subtask['gid']]
+        async for subtask in _iter_asana(f"/tasks/{parent_task_gid}/subtasks", params=_TASK_REF_OPTS)
+        if subtask['gid'] in rank
+    ]
+    kept = _longest_ordered_ranks(current)
+    if len(kept) == len(subtask_gids):
+        return
+    
+    # Subtasks before the first kept one go in front of it, last first; later ones follow their predecessor
+    first_kept = min(kept) if kept else len(subtask_gids)
+    stretches = [[
+        (subtask_gids[i], 'insert_before', subtask_gids[i + 1])
+        for i in range(first_kept - 1, -1, -1)
+        if i + 1 < len(subtask_gids)
+    ]]
+    for i in range(first_kept + 1, len(subtask_gids)):
+        if i in kept:
+            stretches.append([])
+        else:
+            stretches[-1].append((subtask_gids[i], 'insert_after', subtask_gids[i - 1]))
+    
+    async def move(stretch):
+        for subtask_gid, position, anchor_gid in stretch:
+            await _batcher.submit(
+                "POST", f"/tasks/{subtask_gid}/setParent",
+                data={'parent': parent_task_gid, position: anchor_gid}
+            )
+    
+    await asyncio.gather(*[move(stretch) for stretch in stretches if stretch])
+
+async def _create_multiple_subtasks(
     parent_task_name_or_gid: str,
     subtask_list: str,
     project: str = "",
@@ -1052,26 +1848,13 @@ def create_multiple_subtasks(
     priority: str = "",
     client: str = "",
     platform: str = ""
-) -> str:
+) -> tuple:
     """
-    Create multiple subtasks under a parent task from a list.
+    Create subtasks from a list under one parent (the body of the create_multiple_subtasks tool).
     
-    Args:
-        parent_task_name_or_gid: Name or GID of the parent task
-        subtask_list: Comma-separated or newline-separated list of subtask names
-        project: Project name to search in (required if using parent task name)
-        assignee: Assignee for all subtasks (optional)
-        due_date: Due date for all subtasks (optional)
-        priority: Priority for all subtasks (optional)
-        client: Client for all subtasks (optional)
-        platform: Platform for all subtasks (optional)
-        
-    Returns:
-        Summary of created subtasks or error message
+    Returns (summary, created): created pairs each listed name with its new GID (None if
+    that create failed), in input order, and is empty when nothing was attempted.
     """
-    if not tasks_api or not users_api:
-        return "Error: Asana client not initialized. Please check the access token."
-    
     try:
         # Parse the subtask list
         if '\n' in subtask_list:
@@ -1080,102 +1863,112 @@ def create_multiple_subtasks(
             subtasks = [task.strip() for task in subtask_list.split(',') if task.strip()]
         
         if not subtasks:
-            return "Error: No subtasks provided. Please provide a comma-separated or newline-separated list."
+            return "Error: No subtasks provided. Please provide a comma-separated or newline-separated list.", []
         
-        # Find the parent task (same logic as create_subtask)
-        parent_task_gid = None
-        parent_task_name = ""
-        
-        if parent_task_name_or_gid.isdigit() and len(parent_task_name_or_gid) > 10:
-            parent_task_gid = parent_task_name_or_gid
-            # Get parent task name for display
-            try:
-                parent_info = tasks_api.get_task(
-                    task_gid=parent_task_gid,
-                    opts={'opt_fields': 'name'}
-                )
-                parent_task_name = parent_info.get('name', 'Unknown')
-            except:
-                parent_task_name = 'Unknown'
-        else:
-            if not project:
-                return "Error: Project name or GID is required when searching by task name."
-            
-            project_gid = asana_projects.get(project, project)
-            workspace_gid = WORKSPACE_GID
-            
-            tasks = tasks_api.get_tasks_for_project(
-                project_gid=project_gid,
-                opts={'opt_fields': 'name,gid'}
-            )
-            
-            # Handle response format
-            if isinstance(tasks, dict) and 'data' in tasks:
-                tasks = tasks['data']
-            elif not isinstance(tasks, list):
-                tasks = [tasks] if tasks else []
-            
-            matching_tasks = []
-            for task in tasks:
-                if task['name'].lower() == parent_task_name_or_gid.lower():
-                    matching_tasks.append(task)
-                elif parent_task_name_or_gid.lower() in task['name'].lower():
-                    matching_tasks.append(task)
-            
-            if not matching_tasks:
-                return f"❌ No parent task found matching '{parent_task_name_or_gid}' in project '{project}'"
-            elif len(matching_tasks) > 1:
-                task_list = "\n".join([f"• {task['name']} (GID: {task['gid']})" for task in matching_tasks[:5]])
-                return f"❌ Multiple parent tasks found:\n{task_list}\n\nPlease use a more specific name or the exact GID."
-            else:
-                parent_task_gid = matching_tasks[0]['gid']
-                parent_task_name = matching_tasks[0]['name']
+        # Find the parent task
+        parent_task_gid, parent_task_name, error = await _resolve_parent(parent_task_name_or_gid, project)
+        if error:
+            return error, []
         
         # Create all subtasks
         created_subtasks = []
         failed_subtasks = []
         
-        for subtask_name in subtasks:
-            try:
-                # Create subtask with parent relationship
-                subtask_data = _build_task_data(
-                    name=subtask_name, assignee=assignee, due_date=due_date,
-                    priority=priority, client=client, platform=platform
-                )
-                # Set parent to make it a true subtask
-                subtask_data['parent'] = parent_task_gid
-                
-                result = tasks_api.create_task(
-                    body={'data': subtask_data}, 
-                    opts={'opt_fields': 'gid,name,parent.name'}
+        # Resolve the shared fields once; only the name differs between subtasks
+        shared_data = await asyncio.to_thread(
+            _build_create_task_data,
+            assignee=assignee, due_date=due_date,
+            priority=priority, client=client, platform=platform
+        )
+        # Set parent to make them true subtasks
+        shared_data['parent'] = parent_task_gid
+        
+        # Submit every create at once so they are coalesced into /batch calls
+        results = await asyncio.gather(
+            *[
+                _batcher.submit(
+                    "POST", "/tasks",
+                    params=_TASK_REF_OPTS,
+                    data={**shared_data, 'name': subtask_name}
                 )
-                
+                for subtask_name in subtasks
+            ],
+            return_exceptions=True
+        )
+        
+        created = []
+        created_gids = []
+        for subtask_name, result in zip(subtasks, results):
+            if isinstance(result, Exception):
+                created.append((subtask_name, None))
+                failed_subtasks.append(f"❌ {subtask_name}: {str(result)}")
+            else:
+                created.append((subtask_name, result['gid']))
+                created_gids.append(result['gid'])
                 created_subtasks.append(f"✅ {result['name']} (ID: {result['gid']})")
-                
+        
+        # Restore the input order under the parent if the concurrent creates scrambled it
+        order_warning = ""
+        if len(created_gids) > 1:
+            try:
+                await _keep_subtask_order(parent_task_gid, created_gids)
             except Exception as e:
-                failed_subtasks.append(f"❌ {subtask_name}: {str(e)}")
+                order_warning = f"⚠️ Subtasks were created but may not be in list order: {str(e)}\n\n"
         
         # Build result summary
-        result_msg = f"📋 **Subtask Creation Summary**\n"
-        result_msg += f"**Parent Task:** {parent_task_name}\n\n"
+        parts = [f"📋 **Subtask Creation Summary**\n**Parent Task:** {parent_task_name}\n\n"]
+        if order_warning:
+            parts.append(order_warning)
         
         if created_subtasks:
-            result_msg += f"**✅ Successfully Created ({len(created_subtasks)}):**\n"
-            result_msg += "\n".join(created_subtasks) + "\n\n"
+            parts.append(f"**✅ Successfully Created ({len(created_subtasks)}):**\n")
+            parts.append("\n".join(created_subtasks) + "\n\n")
         
         if failed_subtasks:
-            result_msg += f"**❌ Failed ({len(failed_subtasks)}):**\n"
-            result_msg += "\n".join(failed_subtasks) + "\n\n"
+            parts.append(f"**❌ Failed ({len(failed_subtasks)}):**\n")
+            parts.append("\n".join(failed_subtasks) + "\n\n")
         
-        result_msg += f"**Total:** {len(created_subtasks)} created, {len(failed_subtasks)} failed"
+        parts.append(f"**Total:** {len(created_subtasks)} created, {len(failed_subtasks)} failed")
         
-        return result_msg
+        return ''.join(parts), created
         
     except Exception as e:
-        return f"Error creating multiple subtasks: {str(e)}"
+        return f"Error creating multiple subtasks: {str(e)}", []
+
+@mcp.tool()
+async def create_multiple_subtasks(
+    parent_task_name_or_gid: str,
+    subtask_list: str,
+    project: str = "",
+    assignee: str = "",
+    due_date: str = "",
+    priority: str = "",
+    client: str = "",
+    platform: str = ""
+) -> str:
+    """
+    Create multiple subtasks under a parent task from a list.
+    
+    Subtasks are created concurrently, then kept in the order they were listed.
+    
+    Args:
+        parent_task_name_or_gid: Name or GID of the parent task
+        subtask_list: Comma-separated or newline-separated list of subtask names
+        project: Project name to search in (required if using parent task name)
+        assignee: Assignee for all subtasks (optional)
+        due_date: Due date for all subtasks (optional)
+        priority: Priority for all subtasks (optional)
+        client: Client for all subtasks (optional)
+        platform: Platform for all subtasks (optional)
+        
+    Returns:
+        Summary of created subtasks or error message
+    """
+    summary, _ = await _create_multiple_subtasks(parent_task_name_or_gid, subtask_list, project, assignee, due_date, priority, client, platform)
+    return summary
 
 @mcp.tool()
-def list_subtasks(parent_task_name_or_gid: str, project: str = "") -> str:
+async def list_subtasks(parent_task_name_or_gid: str, project: str = "") -> str:
     """
     List all subtasks of a parent task.
     
@@ -1186,94 +1979,35 @@ def list_subtasks(parent_task_name_or_gid: str, project: str = "") -> str:
     Returns:
         List of subtasks or error message
     """
-    if not tasks_api or not users_api:
-        return "Error: Asana client not initialized. Please check the access token."
-    
     try:
-        # Find the parent task (same logic as create_subtask)
-        parent_task_gid = None
-        parent_task_name = ""
-        
-        if parent_task_name_or_gid.isdigit() and len(parent_task_name_or_gid) > 10:
-            parent_task_gid = parent_task_name_or_gid
-            try:
-                parent_info = tasks_api.get_task(
-                    task_gid=parent_task_gid,
-                    opts={'opt_fields': 'name'}
-                )
-                parent_task_name = parent_info.get('name', 'Unknown')
-            except:
-                parent_task_name = 'Unknown'
-        else:
-            if not project:
-                return "Error: Project name or GID is required when searching by task name."
-            
-            project_gid = asana_projects.get(project, project)
-            me = users_api.get_user(user_gid='me', opts={'opt_fields': 'gid,workspaces'})
-            workspace_gid = me['workspaces'][0]['gid']
-            
-            tasks = tasks_api.get_tasks_for_project(
-                project_gid=project_gid,
-                opts={'opt_fields': 'name,gid'}
-            )
-            
-            # Handle response format
-            if isinstance(tasks, dict) and 'data' in tasks:
-                tasks = tasks['data']
-            elif not isinstance(tasks, list):
-                tasks = [tasks] if tasks else []
-            
-            matching_tasks = []
-            for task in tasks:
-                if task['name'].lower() == parent_task_name_or_gid.lower():
-                    matching_tasks.append(task)
-                elif parent_task_name_or_gid.lower() in task['name'].lower():
-                    matching_tasks.append(task)
-            
-            if not matching_tasks:
-                return f"❌ No parent task found matching '{parent_task_name_or_gid}' in project '{project}'"
-            elif len(matching_tasks) > 1:
-                task_list = "\n".join([f"• {task['name']} (GID: {task['gid']})" for task in matching_tasks[:5]])
-                return f"❌ Multiple parent tasks found:\n{task_list}\n\nPlease use a more specific name or the exact GID."
-            else:
-                parent_task_gid = matching_tasks[0]['gid']
-                parent_task_name = matching_tasks[0]['name']
-        
-        # Get subtasks
-        subtasks = tasks_api.get_subtasks_for_task(
-            task_gid=parent_task_gid,
-            opts={'opt_fields': 'name,gid,completed,due_on,assignee.name'}
-        )
-        
-        # Handle response format
-        if isinstance(subtasks, dict) and 'data' in subtasks:
-            subtasks = subtasks['data']
-        elif not isinstance(subtasks, list):
-            subtasks = [subtasks] if subtasks else []
-        
-        if not subtasks:
-            return f"📋 **Parent Task:** {parent_task_name}\n\n❌ No subtasks found."
-        
-        result = f"📋 **Parent Task:** {parent_task_name}\n"
-        result += f"📝 **Subtasks ({len(subtasks)}):**\n\n"
+        # Find the parent task
+        parent_task_gid, parent_task_name, error = await _resolve_parent(parent_task_name_or_gid, project)
+        if error:
+            return error
         
-        for subtask in subtasks:
+        # Format subtasks as their pages arrive; the header (which needs the count) goes in last
+        parts = [None]
+        async for subtask in _iter_asana(f"/tasks/{parent_task_gid}/subtasks", params=_SUBTASK_LIST_OPTS):
             status = "✅" if subtask.get('completed') else "❌"
             name = subtask.get('name', 'No name')
             gid = subtask.get('gid', '')
             due = subtask.get('due_on', 'No due date')
-            assignee = subtask.get('assignee', {}).get('name', 'Unassigned')
+            # Unassigned subtasks come back with a null assignee, not a missing key
+            assignee = a['name'] if (a := subtask.get('assignee')) else 'Unassigned'
             
-            result += f"{status} **{name}** (GID: {gid})\n"
-            result += f"   📅 Due: {due} | 👤 Assigned: {assignee}\n\n"
+            parts.append(f"{status} **{name}** (GID: {gid})\n   📅 Due: {due} | 👤 Assigned: {assignee}\n\n")
         
-        return result
+        if len(parts) == 1:
+            return f"📋 **Parent Task:** {parent_task_name}\n\n❌ No subtasks found."
+        
+        parts[0] = f"📋 **Parent Task:** {parent_task_name}\n📝 **Subtasks ({len(parts) - 1}):**\n\n"
+        return ''.join(parts)
         
     except Exception as e:
         return f"Error listing subtasks: {str(e)}"
 
 @mcp.tool()
-def add_task_dependency(
+async def add_task_dependency(
     dependent_task_name_or_gid: str,
     prerequisite_task_name_or_gid: str,
     project: str = ""
@@ -1289,64 +2023,37 @@ def add_task_dependency(
     Returns:
         Success message or error message
     """
-    if not tasks_api or not users_api:
-        return "Error: Asana client not initialized. Please check the access token."
-    
     try:
         # Helper function to find task GID
-        def find_task_gid(task_identifier, context_name):
-            if task_identifier.isdigit() and len(task_identifier) > 10:
-                return task_identifier
+        async def find_task_gid(task_identifier, context_name):
+            if _is_gid(task_identifier):
+                return task_identifier, None
             
             if not project:
                 return None, f"Error: project is required when searching for {context_name} by name."
             
-            project_gid = asana_projects.get(project, project)
-            workspace_gid = WORKSPACE_GID
-            
-            tasks = tasks_api.get_tasks_for_project(
-                project_gid=project_gid,
-                opts={'opt_fields': 'name,gid'}
-            )
-            
-            if isinstance(tasks, dict) and 'data' in tasks:
-                tasks = tasks['data']
-            elif not isinstance(tasks, list):
-                tasks = [tasks] if tasks else []
-            
-            matching_tasks = []
-            for task in tasks:
-                if task['name'].lower() == task_identifier.lower():
-                    matching_tasks.append(task)
-                elif task_identifier.lower() in task['name'].lower():
-                    matching_tasks.append(task)
-            
-            if not matching_tasks:
-                return None, f"❌ No {context_name} found matching '{task_identifier}' in project '{project}'"
-            elif len(matching_tasks) > 1:
-                task_list = "\n".join([f"• {task['name']} (GID: {task['gid']})" for task in matching_tasks[:3]])
-                return None, f"❌ Multiple {context_name}s found:\n{task_list}\n\nPlease use a more specific name or GID."
-            else:
-                return matching_tasks[0]['gid'], None
+            task, error = await _find_single_project_task(task_identifier, project, context_name)
+            return (task['gid'] if task else None), error
         
         # Find both tasks
-        dependent_gid, error = find_task_gid(dependent_task_name_or_gid, "dependent task")
+        dependent_gid, error = await find_task_gid(dependent_task_name_or_gid, "dependent task")
         if error:
             return error
         
-        prerequisite_gid, error = find_task_gid(prerequisite_task_name_or_gid, "prerequisite task")
+        prerequisite_gid, error = await find_task_gid(prerequisite_task_name_or_gid, "prerequisite task")
         if error:
             return error
         
         # Add the dependency using Asana's dependencies API
-        tasks_api.add_dependencies_for_task(
+        await asyncio.to_thread(
+            tasks_api.add_dependencies_for_task,
             task_gid=dependent_gid,
             body={'data': {'dependencies': [prerequisite_gid]}}
         )
         
         # Get task names for confirmation
-        dependent_info = tasks_api.get_task(dependent_gid, opts={'opt_fields': 'name'})
-        prerequisite_info = tasks_api.get_task(prerequisite_gid, opts={'opt_fields': 'name'})
+        dependent_info = await asyncio.to_thread(tasks_api.get_task, dependent_gid, opts=dict(_NAME_OPTS))
+        prerequisite_info = await asyncio.to_thread(tasks_api.get_task, prerequisite_gid, opts=dict(_NAME_OPTS))
         
         return f"✅ Dependency added successfully!\n🔗 **'{prerequisite_info['name']}'** must be completed before **'{dependent_info['name']}'** can start.\n\n📋 Dependent Task: {dependent_info['name']} (GID: {dependent_gid})\n📋 Prerequisite Task: {prerequisite_info['name']} (GID: {prerequisite_gid})"
         
@@ -1354,7 +2061,7 @@ def add_task_dependency(
         return f"Error adding dependency: {str(e)}"
 
 @mcp.tool()
-def create_subtasks_with_dependencies(
+async def create_subtasks_with_dependencies(
     parent_task_name_or_gid: str,
     subtask_list: str,
     project: str = "",
@@ -1376,12 +2083,9 @@ def create_subtasks_with_dependencies(
     Returns:
         Summary of created subtasks and dependencies
     """
-    if not tasks_api or not users_api:
-        return "Error: Asana client not initialized. Please check the access token."
-    
     try:
-        # First create all subtasks using existing function
-        creation_result = create_multiple_subtasks(
+        # First create all subtasks using the shared helper
+        creation_result, created = await _create_multiple_subtasks(
             parent_task_name_or_gid=parent_task_name_or_gid,
             subtask_list=subtask_list,
             project=project,
@@ -1389,47 +2093,42 @@ def create_subtasks_with_dependencies(
             priority=priority
         )
         
-        # If creation failed, return the error
-        if "Error" in creation_result or "❌" in creation_result:
+        # If creation failed (entirely or for any subtask), return the summary as is
+        if not created or any(gid is None for _, gid in created):
             return creation_result
         
         result_msg = creation_result
         
-        # If sequential dependencies requested, create them
-        if create_sequential_dependencies:
-            # Parse the subtask list to get names in order
-            if '\n' in subtask_list:
-                subtask_names = [task.strip() for task in subtask_list.split('\n') if task.strip()]
-            else:
-                subtask_names = [task.strip() for task in subtask_list.split(',') if task.strip()]
+        # If sequential dependencies requested, chain the new subtasks by GID in list order,
+        # so repeated names and older subtasks with the same name can't be picked up
+        if create_sequential_dependencies and len(created) > 1:
+            result_msg += "\n\n🔗 **Creating Sequential Dependencies:**\n"
+            
+            dependencies_created = 0
+            dependencies_failed = 0
+            
+            # Create dependencies: subtask[i] depends on subtask[i-1]
+            pairs = list(zip(created[1:], created))
+            results = await asyncio.gather(
+                *[
+                    _batcher.submit(
+                        "POST", f"/tasks/{dependent_gid}/addDependencies",
+                        data={'dependencies': [prerequisite_gid]}
+                    )
+                    for (_, dependent_gid), (_, prerequisite_gid) in pairs
+                ],
+                return_exceptions=True
+            )
             
-            if len(subtask_names) > 1:
-                result_msg += "\n\n🔗 **Creating Sequential Dependencies:**\n"
-                
-                dependencies_created = 0
-                dependencies_failed = 0
-                
-                # Create dependencies: subtask[i] depends on subtask[i-1]
-                for i in range(1, len(subtask_names)):
-                    try:
-                        dependency_result = add_task_dependency(
-                            dependent_task_name_or_gid=subtask_names[i],
-                            prerequisite_task_name_or_gid=subtask_names[i-1],
-                            project=project
-                        )
-                        
-                        if "✅" in dependency_result:
-                            result_msg += f"✅ {subtask_names[i]} depends on {subtask_names[i-1]}\n"
-                            dependencies_created += 1
-                        else:
-                            result_msg += f"❌ Failed to create dependency: {subtask_names[i]} → {subtask_names[i-1]}\n"
-                            dependencies_failed += 1
-                            
-                    except Exception as e:
-                        result_msg += f"❌ Failed to create dependency: {subtask_names[i]} → {subtask_names[i-1]}: {str(e)}\n"
-                        dependencies_failed += 1
-                
-                result_msg += f"\n📊 **Dependencies Summary:** {dependencies_created} created, {dependencies_failed} failed"
+            for ((dependent, _), (prerequisite, _)), result in zip(pairs, results):
+                if isinstance(result, Exception):
+                    result_msg += f"❌ Failed to create dependency: {dependent} → {prerequisite}: {str(result)}\n"
+                    dependencies_failed += 1
+                else:
+                    result_msg += f"✅ {dependent} depends on {prerequisite}\n"
+                    dependencies_created += 1
+            
+            result_msg += f"\n📊 **Dependencies Summary:** {dependencies_created} created, {dependencies_failed} failed"
         
         return result_msg
         
@@ -1437,7 +2136,7 @@ def create_subtasks_with_dependencies(
         return f"Error creating subtasks with dependencies: {str(e)}"
 
 @mcp.tool()
-def list_task_dependencies(task_name_or_gid: str, project: str = "") -> str:
+async def list_task_dependencies(task_name_or_gid: str, project: str = "") -> str:
     """
     List dependencies for a task (what it depends on and what depends on it).
     
@@ -1448,59 +2147,31 @@ def list_task_dependencies(task_name_or_gid: str, project: str = "") -> str:
     Returns:
         List of task dependencies
     """
-    if not tasks_api or not users_api:
-        return "Error: Asana client not initialized. Please check the access token."
-    
     try:
         # Find the task
         task_gid = None
         task_name = ""
         
-        if task_name_or_gid.isdigit() and len(task_name_or_gid) > 10:
+        if _is_gid(task_name_or_gid):
             task_gid = task_name_or_gid
-            try:
-                task_info = tasks_api.get_task(task_gid, opts={'opt_fields': 'name'})
-                task_name = task_info.get('name', 'Unknown')
-            except:
-                task_name = 'Unknown'
         else:
             if not project:
                 return "Error: project is required when searching by task name."
             
-            project_gid = asana_projects.get(project, project)
-            workspace_gid = WORKSPACE_GID
-            
-            tasks = tasks_api.get_tasks_for_project(
-                project_gid=project_gid,
-                opts={'opt_fields': 'name,gid'}
-            )
-            
-            if isinstance(tasks, dict) and 'data' in tasks:
-                tasks = tasks['data']
-            elif not isinstance(tasks, list):
-                tasks = [tasks] if tasks else []
-            
-            matching_tasks = []
-            for task in tasks:
-                if task['name'].lower() == task_name_or_gid.lower():
-                    matching_tasks.append(task)
-                elif task_name_or_gid.lower() in task['name'].lower():
-                    matching_tasks.append(task)
-            
-            if not matching_tasks:
-                return f"❌ No task found matching '{task_name_or_gid}' in project '{project}'"
-            elif len(matching_tasks) > 1:
-                task_list = "\n".join([f"• {task['name']} (GID: {task['gid']})" for task in matching_tasks[:5]])
-                return f"❌ Multiple tasks found:\n{task_list}\n\nPlease use a more specific name or the exact GID."
-            else:
-                task_gid = matching_tasks[0]['gid']
-                task_name = matching_tasks[0]['name']
+            task, error = await _find_single_project_task(task_name_or_gid, project)
+            if error:
+                return error
+            task_gid = task['gid']
+            task_name = task['name']
         
         # Get task with dependencies
-        task_info = tasks_api.get_task(
+        task_info = await asyncio.to_thread(
+            tasks_api.get_task,
             task_gid=task_gid,
-            opts={'opt_fields': 'name,dependencies.name,dependencies.gid,dependents.name,dependents.gid'}
+            opts=dict(_DEPENDENCY_OPTS)
         )
+        # A GID lookup has no name yet; this fetch already carries it
+        task_name = task_name or task_info.get('name', 'Unknown')
         
         dependencies = task_info.get('dependencies', [])
         dependents = task_info.get('dependents', [])
@@ -1534,83 +2205,48 @@ def list_task_dependencies(task_name_or_gid: str, project: str = "") -> str:
     except Exception as e:
         return f"Error listing task dependencies: {str(e)}"
 
-@mcp.tool()
-def move_task_to_project(
+async def _move_task_to_project(
     task_name_or_gid: str,
     from_project: str,
     to_project: str,
     keep_in_original: bool = False
 ) -> str:
     """
-    Move a task from one project to another.
-    
-    Args:
-        task_name_or_gid: Name or GID of the task to move
-        from_project: Current project name or GID (required if using task name)
-        to_project: Destination project name or GID
-        keep_in_original: If True, keeps task in original project (adds to both projects)
-        
-    Returns:
-        Success message or error message
+    Move a task between projects (the body of the move_task_to_project tool).
     """
-    if not tasks_api or not users_api:
-        return "Error: Asana client not initialized. Please check the access token."
-    
     try:
         # Find the task
         task_gid = None
         task_name = ""
         
-        if task_name_or_gid.isdigit() and len(task_name_or_gid) > 10:
+        if _is_gid(task_name_or_gid):
             task_gid = task_name_or_gid
             try:
-                task_info = tasks_api.get_task(
+                task_info = await asyncio.to_thread(
+                    tasks_api.get_task,
                     task_gid=task_gid,
-                    opts={'opt_fields': 'name,projects'}
+                    opts=dict(_NAME_OPTS)
                 )
                 task_name = task_info.get('name', 'Unknown')
-            except:
+            except Exception:
                 task_name = 'Unknown'
         else:
             if not from_project:
                 return "Error: from_project is required when searching by task name."
             
-            from_project_gid = asana_projects.get(from_project, from_project)
-            workspace_gid = WORKSPACE_GID
-            
-            tasks = tasks_api.get_tasks_for_project(
-                project_gid=from_project_gid,
-                opts={'opt_fields': 'name,gid'}
-            )
-            
-            # Handle response format
-            if isinstance(tasks, dict) and 'data' in tasks:
-                tasks = tasks['data']
-            elif not isinstance(tasks, list):
-                tasks = [tasks] if tasks else []
-            
-            matching_tasks = []
-            for task in tasks:
-                if task['name'].lower() == task_name_or_gid.lower():
-                    matching_tasks.append(task)
-                elif task_name_or_gid.lower() in task['name'].lower():
-                    matching_tasks.append(task)
-            
-            if not matching_tasks:
-                return f"❌ No task found matching '{task_name_or_gid}' in project '{from_project}'"
-            elif len(matching_tasks) > 1:
-                task_list = "\n".join([f"• {task['name']} (GID: {task['gid']})" for task in matching_tasks[:5]])
-                return f"❌ Multiple tasks found:\n{task_list}\n\nPlease use a more specific name or the exact GID."
-            else:
-                task_gid = matching_tasks[0]['gid']
-                task_name = matching_tasks[0]['name']
+            task, error = await _find_single_project_task(task_name_or_gid, from_project)
+            if error:
+                return error
+            task_gid = task['gid']
+            task_name = task['name']
         
         # Get project GIDs
-        from_project_gid = asana_projects.get(from_project, from_project) if from_project else None
-        to_project_gid = asana_projects.get(to_project, to_project)
+        from_project_gid = await asyncio.to_thread(_resolve_project_gid, from_project) if from_project else None
+        to_project_gid = await asyncio.to_thread(_resolve_project_gid, to_project)
         
         # Add task to new project
-        tasks_api.add_project_for_task(
+        await asyncio.to_thread(
+            tasks_api.add_project_for_task,
             task_gid=task_gid,
             body={'data': {'project': to_project_gid}}
         )
@@ -1619,18 +2255,41 @@ def move_task_to_project(
         
         # Remove from original project if not keeping
         if not keep_in_original and from_project_gid:
-            tasks_api.remove_project_for_task(
+            await asyncio.to_thread(
+                tasks_api.remove_project_for_task,
                 task_gid=task_gid,
                 body={'data': {'project': from_project_gid}}
             )
+        _invalidate_task(task_gid)
         
-        return f"✅ Task '{task_name}' successfully {action_type} project '{to_project}'!\nTask GID: {task_gid}"
+        return f"✅ Task '{task_name}' successfully {action_type} project '{_project_label(to_project)}'!\nTask GID: {task_gid}"
         
     except Exception as e:
         return f"Error moving task: {str(e)}"
 
 @mcp.tool()
-def move_multiple_tasks(
+async def move_task_to_project(
+    task_name_or_gid: str,
+    from_project: str,
+    to_project: str,
+    keep_in_original: bool = False
+) -> str:
+    """
+    Move a task from one project to another.
+    
+    Args:
+        task_name_or_gid: Name or GID of the task to move
+        from_project: Current project name or GID (required if using task name)
+        to_project: Destination project name or GID
+        keep_in_original: If True, keeps task in original project (adds to both projects)
+        
+    Returns:
+        Success message or error message
+    """
+    return await _move_task_to_project(task_name_or_gid, from_project, to_project, keep_in_original)
+
+@mcp.tool()
+async def move_multiple_tasks(
     task_list: str,
     from_project: str,
     to_project: str,
@@ -1648,9 +2307,6 @@ def move_multiple_tasks(
     Returns:
         Summary of moved tasks or error message
     """
-    if not tasks_api or not users_api:
-        return "Error: Asana client not initialized. Please check the access token."
-    
     try:
         # Parse the task list
         if '\n' in task_list:
@@ -1661,17 +2317,13 @@ def move_multiple_tasks(
         if not tasks:
             return "Error: No tasks provided. Please provide a comma-separated or newline-separated list."
         
-        # Get project GIDs
-        from_project_gid = asana_projects.get(from_project, from_project)
-        to_project_gid = asana_projects.get(to_project, to_project)
-        
         moved_tasks = []
         failed_tasks = []
         
         for task_identifier in tasks:
             try:
-                # Use the single move function for each task
-                result = move_task_to_project(
+                # Use the single move helper for each task
+                result = await _move_task_to_project(
                     task_name_or_gid=task_identifier,
                     from_project=from_project,
                     to_project=to_project,
@@ -1689,7 +2341,7 @@ def move_multiple_tasks(
         # Build result summary
         action_type = "copied to" if keep_in_original else "moved to"
         result_msg = f"📋 **Task {action_type.title()} Summary**\n"
-        result_msg += f"**From:** {from_project} → **To:** {to_project}\n\n"
+        result_msg += f"**From:** {_project_label(from_project)} → **To:** {_project_label(to_project)}\n\n"
         
         if moved_tasks:
             result_msg += f"**✅ Successfully {action_type.title()} ({len(moved_tasks)}):**\n"
@@ -1707,7 +2359,7 @@ def move_multiple_tasks(
         return f"Error moving multiple tasks: {str(e)}"
 
 @mcp.tool()
-def add_task_to_additional_projects(
+async def add_task_to_additional_projects(
     task_name_or_gid: str,
     current_project: str,
     additional_projects: str
@@ -1723,57 +2375,31 @@ def add_task_to_additional_projects(
     Returns:
         Success message or error message
     """
-    if not tasks_api or not users_api:
-        return "Error: Asana client not initialized. Please check the access token."
-    
     try:
         # Find the task (same logic as move_task_to_project)
         task_gid = None
         task_name = ""
         
-        if task_name_or_gid.isdigit() and len(task_name_or_gid) > 10:
+        if _is_gid(task_name_or_gid):
             task_gid = task_name_or_gid
             try:
-                task_info = tasks_api.get_task(
+                task_info = await asyncio.to_thread(
+                    tasks_api.get_task,
                     task_gid=task_gid,
-                    opts={'opt_fields': 'name'}
+                    opts=dict(_NAME_OPTS)
                 )
                 task_name = task_info.get('name', 'Unknown')
-            except:
+            except Exception:
                 task_name = 'Unknown'
         else:
             if not current_project:
                 return "Error: current_project is required when searching by task name."
             
-            current_project_gid = asana_projects.get(current_project, current_project)
-            workspace_gid = WORKSPACE_GID
-            
-            tasks = tasks_api.get_tasks_for_project(
-                project_gid=current_project_gid,
-                opts={'opt_fields': 'name,gid'}
-            )
-            
-            # Handle response format
-            if isinstance(tasks, dict) and 'data' in tasks:
-                tasks = tasks['data']
-            elif not isinstance(tasks, list):
-                tasks = [tasks] if tasks else []
-            
-            matching_tasks = []
-            for task in tasks:
-                if task['name'].lower() == task_name_or_gid.lower():
-                    matching_tasks.append(task)
-                elif task_name_or_gid.lower() in task['name'].lower():
-                    matching_tasks.append(task)
-            
-            if not matching_tasks:
-                return f"❌ No task found matching '{task_name_or_gid}' in project '{current_project}'"
-            elif len(matching_tasks) > 1:
-                task_list = "\n".join([f"• {task['name']} (GID: {task['gid']})" for task in matching_tasks[:5]])
-                return f"❌ Multiple tasks found:\n{task_list}\n\nPlease use a more specific name or the exact GID."
-            else:
-                task_gid = matching_tasks[0]['gid']
-                task_name = matching_tasks[0]['name']
+            task, error = await _find_single_project_task(task_name_or_gid, current_project)
+            if error:
+                return error
+            task_gid = task['gid']
+            task_name = task['name']
         
         # Parse additional projects
         project_names = [p.strip() for p in additional_projects.split(',') if p.strip()]
@@ -1786,14 +2412,16 @@ def add_task_to_additional_projects(
         
         for project_name in project_names:
             try:
-                project_gid = asana_projects.get(project_name, project_name)
+                project_gid = await asyncio.to_thread(_resolve_project_gid, project_name)
                 
-                tasks_api.add_project_for_task(
+                await asyncio.to_thread(
+                    tasks_api.add_project_for_task,
                     task_gid=task_gid,
                     body={'data': {'project': project_gid}}
                 )
+                _invalidate_task(task_gid)
                 
-                added_projects.append(f"✅ {project_name}")
+                added_projects.append(f"✅ {_project_label(project_name)}")
                 
             except Exception as e:
                 failed_projects.append(f"❌ {project_name}: {str(e)}")
@@ -1818,7 +2446,7 @@ def add_task_to_additional_projects(
         return f"Error adding task to additional projects: {str(e)}"
 
 @mcp.tool()
-def get_task_projects(task_name_or_gid: str, current_project: str = "") -> str:
+async def get_task_projects(task_name_or_gid: str, current_project: str = "") -> str:
     """
     Show which projects a task is currently in.
     
@@ -1829,55 +2457,28 @@ def get_task_projects(task_name_or_gid: str, current_project: str = "") -> str:
     Returns:
         List of projects the task is in
     """
-    if not tasks_api or not users_api:
-        return "Error: Asana client not initialized. Please check the access token."
-    
     try:
         # Find the task
         task_gid = None
         task_name = ""
         
-        if task_name_or_gid.isdigit() and len(task_name_or_gid) > 10:
+        if _is_gid(task_name_or_gid):
             task_gid = task_name_or_gid
         else:
             if not current_project:
                 return "Error: current_project is required when searching by task name."
             
-            current_project_gid = asana_projects.get(current_project, current_project)
-            me = users_api.get_user(user_gid='me', opts={'opt_fields': 'gid,workspaces'})
-            workspace_gid = me['workspaces'][0]['gid']
-            
-            tasks = tasks_api.get_tasks_for_project(
-                project_gid=current_project_gid,
-                opts={'opt_fields': 'name,gid'}
-            )
-            
-            # Handle response format
-            if isinstance(tasks, dict) and 'data' in tasks:
-                tasks = tasks['data']
-            elif not isinstance(tasks, list):
-                tasks = [tasks] if tasks else []
-            
-            matching_tasks = []
-            for task in tasks:
-                if task['name'].lower() == task_name_or_gid.lower():
-                    matching_tasks.append(task)
-                elif task_name_or_gid.lower() in task['name'].lower():
-                    matching_tasks.append(task)
-            
-            if not matching_tasks:
-                return f"❌ No task found matching '{task_name_or_gid}' in project '{current_project}'"
-            elif len(matching_tasks) > 1:
-                task_list = "\n".join([f"• {task['name']} (GID: {task['gid']})" for task in matching_tasks[:5]])
-                return f"❌ Multiple tasks found:\n{task_list}\n\nPlease use a more specific name or the exact GID."
-            else:
-                task_gid = matching_tasks[0]['gid']
-                task_name = matching_tasks[0]['name']
+            task, error = await _find_single_project_task(task_name_or_gid, current_project)
+            if error:
+                return error
+            task_gid = task['gid']
+            task_name = task['name']
         
         # Get task with projects
-        task_info = tasks_api.get_task(
+        task_info = await asyncio.to_thread(
+            tasks_api.get_task,
             task_gid=task_gid,
-            opts={'opt_fields': 'name,projects.name,projects.gid'}
+            opts=dict(_TASK_PROJECTS_OPTS)
         )
         
         task_name = task_info.get('name', 'Unknown')
@@ -1900,4 +2501,9 @@ def get_task_projects(task_name_or_gid: str, current_project: str = "") -> str:
         return f"Error getting task projects: {str(e)}"
 
 if __name__ == "__main__":
-    mcp.run(transport="http", port=8000)
\ No newline at end of file
+    # Every tool is network glue, so a faster event loop raises tool-call throughput.
+    # uvloop.run starts just this loop on uvloop, without touching the global policy.
+    if uvloop is not None:
+        uvloop.run(mcp.run_async(transport="http", port=8000))
+    else:
+        mcp.run(transport="http", port=8000)